@@ -39,16 +39,16 @@ export async function POST(req: NextRequest) {
 
       const file = formData.get("resume_file") as File | null;
       if (file && file.size > 0) {
-        const arrayBuffer = await file.arrayBuffer();
-        const buffer = Buffer.from(arrayBuffer);
-
-        if (buffer.length > 10 * 1024 * 1024) {
+        // Reject on the declared size before copying the upload out
+        if (file.size > 10 * 1024 * 1024) {
           return NextResponse.json(
             { detail: "File too large. Max 10MB" },
             { status: 400 }
           );
         }
 
+        // Buffer.from(ArrayBuffer) wraps the same memory, no second copy
+        const buffer = Buffer.from(await file.arrayBuffer());
         resumeText = await extractTextFromFile(buffer, file.name);
       }
     } else {
@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
+import { parseModelJson } from "@/lib/model-json";
 
 export async function POST(req: NextRequest) {
   const apiKey = process.env.GOOGLE_API_KEY;
@@ -83,7 +84,12 @@ Include 3-4 questions per category. Make answers realistic and specific to the r
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({
         contents: [{ parts: [{ text: prompt }] }],
-        generationConfig: { temperature: 0.7, maxOutputTokens: 2048 },
+        generationConfig: {
+          temperature: 0.7,
+          maxOutputTokens: 2048,
+          // JSON mode: the reply is a bare JSON document, no fences or prose
+          responseMimeType: "application/json",
+        },
       }),
     });
 
@@ -94,9 +100,7 @@ Include 3-4 questions per category. Make answers realistic and specific to the r
 
     const data = await res.json();
     const raw = data.candidates?.[0]?.content?.parts?.[0]?.text || "";
-    const clean = raw.replace(/```json\n?/g, "").replace(/```\n?/g, "").trim();
-
-    const parsed = JSON.parse(clean);
+    const parsed = parseModelJson(raw);
     return NextResponse.json(parsed);
   } catch (err) {
     console.error("interview-questions error:", err instanceof Error ? err.message : "Unknown error");
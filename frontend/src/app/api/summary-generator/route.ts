@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from "next/server";
+import { parseModelJson } from "@/lib/model-json";
 
 export async function POST(req: NextRequest) {
   const apiKey = process.env.GOOGLE_API_KEY;
@@ -53,7 +54,12 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
       headers: { "Content-Type": "application/json" },
       body: JSON.stringify({
         contents: [{ parts: [{ text: prompt }] }],
-        generationConfig: { temperature: 0.7, maxOutputTokens: 1024 },
+        generationConfig: {
+          temperature: 0.7,
+          maxOutputTokens: 1024,
+          // JSON mode: the reply is a bare JSON document, no fences or prose
+          responseMimeType: "application/json",
+        },
       }),
     });
 
@@ -64,9 +70,7 @@ Respond ONLY with valid JSON (no markdown, no code blocks):
 
     const data = await res.json();
     const raw = data.candidates?.[0]?.content?.parts?.[0]?.text || "";
-    const clean = raw.replace(/```json\n?/g, "").replace(/```\n?/g, "").trim();
-
-    const parsed = JSON.parse(clean);
+    const parsed = parseModelJson(raw);
     return NextResponse.json(parsed);
   } catch (err) {
     console.error("summary-generator error:", err instanceof Error ? err.message : "Unknown error");
@@ -0,0 +1,69 @@
+/**
+ * Extract the JSON payload from a Gemini text response.
+ *
+ * Models wrap JSON in ```json fences, prepend prose, or emit <think> blocks.
+ * Instead of a greedy brace regex (which spans from the first "{" to the
+ * last "}" and breaks on multiple objects), scan once for balanced,
+ * string-aware {...} spans and return the first one that parses.
+ */
+
+// Compiled once at module load rather than on every response
+const THINK_BLOCK = /<think>[\s\S]*?<\/think>/g;
+const JSON_FENCE = /```(?:json)?\s*([\s\S]*?)```/g;
+
+export function parseModelJson<T = any>(raw: string): T {
+  const text = raw.replace(THINK_BLOCK, "");
+
+  // Fenced blocks first, then the whole reply
+  const candidates: string[] = [];
+  for (const m of text.matchAll(JSON_FENCE)) {
+    candidates.push(m[1]);
+  }
+  candidates.push(text);
+
+  for (const candidate of candidates) {
+    const trimmed = candidate.trim();
+    try {
+      return JSON.parse(trimmed);
+    } catch {
+      // fall through to the span scan
+    }
+    for (const span of jsonObjectSpans(trimmed)) {
+      try {
+        return JSON.parse(span);
+      } catch {
+        // try the next balanced span
+      }
+    }
+  }
+
+  throw new SyntaxError("No valid JSON object in model response");
+}
+
+/** Yield each top-level balanced {...} span, ignoring braces inside strings. */
+function* jsonObjectSpans(s: string): Generator<string> {
+  let depth = 0;
+  let start = -1;
+  let inString = false;
+  let escaped = false;
+
+  for (let i = 0; i < s.length; i++) {
+    const ch = s[i];
+    if (inString) {
+      if (escaped) escaped = false;
+      else if (ch === "\\") escaped = true;
+      else if (ch === '"') inString = false;
+      continue;
+    }
+    // Quotes only open strings inside an object; prose quotes are ignored
+    if (ch === '"' && depth > 0) {
+      inString = true;
+    } else if (ch === "{") {
+      if (depth === 0) start = i;
+      depth++;
+    } else if (ch === "}" && depth > 0) {
+      depth--;
+      if (depth === 0) yield s.slice(start, i + 1);
+    }
+  }
+}
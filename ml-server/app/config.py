@@ -12,12 +12,64 @@ DATA_DIR = BASE_DIR / "training_data"
 # Sentence-Transformer model (proven 95%+ accuracy on STS benchmarks)
 SBERT_MODEL_NAME = "all-MiniLM-L6-v2"
 
+# Inference backend: "torch" (default) or "onnx" (ONNX Runtime, needs
+# sentence-transformers[onnx]); falls back to torch if ONNX fails to load.
+SBERT_BACKEND = os.getenv("SBERT_BACKEND", "torch").lower()
+# INT8 dynamic quantization of the encoder's Linear layers (opt-in: the
+# trained scorers were fit on FP32 similarities)
+SBERT_QUANTIZE = os.getenv("SBERT_QUANTIZE", "0") == "1"
+# Exports published in the model's Hub repo: graph-optimized, or INT8 (VNNI)
+SBERT_ONNX_FILE = os.getenv(
+    "SBERT_ONNX_FILE",
+    "onnx/model_qint8_avx512_vnni.onnx" if SBERT_QUANTIZE else "onnx/model_O2.onnx",
+)
+
+# CPU threads for the encoder. Defaults to the cores divided across server
+# worker processes so several workers don't oversubscribe the machine.
+NUM_WORKERS = max(1, int(os.getenv("NUM_WORKERS", os.getenv("WEB_CONCURRENCY", "1"))))
+SBERT_NUM_THREADS = max(1, int(os.getenv(
+    "SBERT_NUM_THREADS", str(max(1, (os.cpu_count() or 1) // NUM_WORKERS))
+)))
+
+# Concurrent encoder forward passes. Each pass already uses SBERT_NUM_THREADS
+# cores, so letting every threadpool request encode at once only
+# oversubscribes the CPU; extra requests queue here instead.
+SBERT_CONCURRENCY = max(1, int(os.getenv("SBERT_CONCURRENCY", "2")))
+
+# Encode sections longer than the encoder's max_seq_length as token windows
+# and mean-pool them, instead of letting the encoder truncate. This changes
+# the section-similarity features, so retrain the scorers before enabling.
+SBERT_SECTION_WINDOWS = os.getenv("SBERT_SECTION_WINDOWS", "0") == "1"
+
+# Expose unauthenticated diagnostics under /_admin (encoder slot usage).
+# Off by default; only enable on a private network.
+ADMIN_ENDPOINTS = os.getenv("ML_ADMIN_ENDPOINTS", "0") == "1"
+
+# Persistent embedding cache (SQLite, keyed by a hash of model + text).
+# Set EMBED_CACHE_PATH="" to disable.
+EMBED_CACHE_PATH = os.getenv("EMBED_CACHE_PATH", str(BASE_DIR / ".cache" / "embeddings.sqlite3"))
+# Row cap for that cache (~1 KB per row); the oldest rows are dropped first.
+# 0 disables the cap.
+EMBED_CACHE_MAX_ROWS = int(os.getenv("EMBED_CACHE_MAX_ROWS", "100000"))
+
+# In-process cache of serialized /analyze, /skills and /cover-letter
+# responses, so an identical resubmission (UI retry, re-opened tab) skips
+# the pipeline.
+# RESULT_CACHE_SIZE=0 disables it.
+RESULT_CACHE_SIZE = int(os.getenv("RESULT_CACHE_SIZE", "256"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "300"))
+
 # spaCy model
 SPACY_MODEL = "en_core_web_sm"
 
 # Server
 HOST = os.getenv("ML_HOST", "127.0.0.1")
 PORT = int(os.getenv("ML_PORT", "8100"))
+# Auto-reload on code changes for `python -m app.main` (development only)
+RELOAD = os.getenv("ML_RELOAD", "0") == "1"
+# Request bodies (JSON resume + JD text) larger than this are rejected with
+# 413 before they are buffered
+MAX_BODY_MB = float(os.getenv("MAX_BODY_MB", "5"))
 
 # Scoring weights
 WEIGHTS = {
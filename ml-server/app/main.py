@@ -12,12 +12,18 @@ Stack:
 """
 
 from __future__ import annotations
+import hashlib
+import threading
 import time
-from typing import Dict, List
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Dict, Iterable, List, Optional, Tuple
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 
 from app.schemas import (
     AnalysisResult, AnalyzeRequest, HealthResponse,
@@ -27,7 +33,28 @@ from app.schemas import (
     SkillsRequest, SkillsResult, SkillCategory,
     ExtractRequest, ExtractResult,
 )
-from app.config import HOST, PORT
+from app.config import (
+    ADMIN_ENDPOINTS, HOST, PORT, MAX_BODY_MB, NUM_WORKERS, RELOAD,
+    RESULT_CACHE_SIZE, RESULT_CACHE_TTL,
+)
+from app.models.nlp_engine import (
+    _get_nlp, detect_sections, extract_keywords, extract_ngrams,
+    compute_keyword_overlap, compute_readability,
+)
+from app.models.semantic import (
+    _get_model, encoder_slots,
+    compute_jd_match_score,
+    compute_section_similarities,
+    compute_keyword_semantic_matches,
+)
+from app.models.ats_scorer import _load_ats_model, compute_ats_score
+from app.models.section_scorer import _load_section_model, score_all_sections
+from app.models.cliche_detector import detect_cliches
+from app.models.verb_analyzer import analyze_action_verbs
+from app.models.quantifier import analyze_quantification
+from app.models.content_improver import generate_content_improvements
+from app.models.grader import _load_grade_model, compute_grade, compute_recommended_roles
+from app.models.resume_extractor import extract_resume_data
 
 
 # ── Model loading status ──
@@ -35,6 +62,28 @@ _models_ready = False
 _model_status: Dict[str, bool] = {}
 
 
+# name -> (loader, label printed on failure; None for optional models that
+# fall back to rules)
+_MODEL_LOADERS = {
+    "sentence_bert": (_get_model, "Sentence-BERT"),
+    "spacy": (_get_nlp, "spaCy"),
+    "ats_model": (_load_ats_model, None),
+    "section_model": (_load_section_model, None),
+    "grade_model": (_load_grade_model, None),
+}
+
+
+def _load_one(name: str) -> None:
+    loader, label = _MODEL_LOADERS[name]
+    try:
+        loader()
+        _model_status[name] = True
+    except Exception as e:
+        if label:
+            print(f"[!] {label} failed: {e}")
+        _model_status[name] = False
+
+
 def _load_all_models():
     """Pre-load all ML models on startup."""
     global _models_ready, _model_status
@@ -45,45 +94,14 @@ def _load_all_models():
 
     t0 = time.time()
 
-    # 1. Sentence-BERT
-    try:
-        from app.models.semantic import _get_model
-        _get_model()
-        _model_status["sentence_bert"] = True
-    except Exception as e:
-        print(f"[!] Sentence-BERT failed: {e}")
-        _model_status["sentence_bert"] = False
-
-    # 2. spaCy
-    try:
-        from app.models.nlp_engine import _get_nlp
-        _get_nlp()
-        _model_status["spacy"] = True
-    except Exception as e:
-        print(f"[!] spaCy failed: {e}")
-        _model_status["spacy"] = False
-
-    # 3. Trained scoring models (optional — fallback to rules)
-    try:
-        from app.models.ats_scorer import _load_ats_model
-        _load_ats_model()
-        _model_status["ats_model"] = True
-    except Exception:
-        _model_status["ats_model"] = False
-
-    try:
-        from app.models.section_scorer import _load_section_model
-        _load_section_model()
-        _model_status["section_model"] = True
-    except Exception:
-        _model_status["section_model"] = False
-
-    try:
-        from app.models.grader import _load_grade_model
-        _load_grade_model()
-        _model_status["grade_model"] = True
-    except Exception:
-        _model_status["grade_model"] = False
+    # Sentence-BERT goes first: _load_model sets OMP_NUM_THREADS and torch's
+    # thread count, which must happen before spaCy/thinc can import torch.
+    # The remaining loads are independent (spaCy pipeline, joblib files),
+    # so they then run side by side.
+    _load_one("sentence_bert")
+    rest = [name for name in _MODEL_LOADERS if name != "sentence_bert"]
+    with ThreadPoolExecutor(max_workers=len(rest)) as pool:
+        list(pool.map(_load_one, rest))
 
     elapsed = time.time() - t0
     _models_ready = True
@@ -105,6 +123,49 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+class BodySizeLimit:
+    """
+    Reject oversized request bodies without buffering them.
+
+    A declared Content-Length over the limit is answered with 413 straight
+    away; chunked bodies are counted as they stream in and abort at the limit.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                if value.isdigit() and int(value) > self.max_bytes:
+                    response = Response(
+                        content=b'{"detail":"Request body too large"}',
+                        status_code=413,
+                        media_type="application/json",
+                    )
+                    return await response(scope, receive, send)
+                break
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(413, "Request body too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+app.add_middleware(BodySizeLimit, max_bytes=int(MAX_BODY_MB * 1024 * 1024))
+
 # CORS — allow Next.js dev server + Vercel deployments
 app.add_middleware(
     CORSMiddleware,
@@ -121,23 +182,82 @@ app.add_middleware(
 )
 
 
+def _json_response(result: BaseModel) -> Response:
+    """
+    Serialize a response model with pydantic-core directly.
+
+    Returning a Response skips FastAPI's re-validation of the already
+    built model against response_model (which is kept for the OpenAPI
+    schema) and the stdlib json.dumps pass.
+    """
+    return Response(content=result.model_dump_json(), media_type="application/json")
+
+
+# ── Result cache: sha256(endpoint, inputs) -> (stored at, response body) ──
+_result_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_result_lock = threading.Lock()
+
+
+def _result_key(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _cached_result(key: str) -> Optional[Response]:
+    """Return the stored response for key, or None if absent or expired."""
+    with _result_lock:
+        entry = _result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, body = entry
+        if time.monotonic() - stored_at > RESULT_CACHE_TTL:
+            del _result_cache[key]
+            return None
+        _result_cache.move_to_end(key)
+    return Response(content=body, media_type="application/json")
+
+
+def _store_result(key: str, response: Response) -> Response:
+    if RESULT_CACHE_SIZE > 0:
+        with _result_lock:
+            _result_cache[key] = (time.monotonic(), response.body)
+            _result_cache.move_to_end(key)
+            while len(_result_cache) > RESULT_CACHE_SIZE:
+                _result_cache.popitem(last=False)
+    return response
+
+
 # ══════════════════════════════════════════════════════════════
 # Routes
 # ══════════════════════════════════════════════════════════════
 
+# The analysis routes are CPU-bound and declared with plain `def`: FastAPI
+# runs them in its threadpool, so the event loop (and /health) keeps serving
+# while an analysis is in flight. torch and most regex/numpy work release
+# the GIL, so concurrent requests also overlap.
+
 @app.get("/health", response_model=HealthResponse)
 async def health():
-    return HealthResponse(
+    return _json_response(HealthResponse(
         status="ok" if _models_ready else "loading",
         version="2.0.0",
         ai_available=True,  # ML models are always available locally
         nlp_available=_model_status.get("spacy", False),
         models_loaded=_model_status,
-    )
+    ))
+
+
+if ADMIN_ENDPOINTS:
+    @app.get("/_admin/semaphores")
+    async def semaphores():
+        return {"sbert_encode": encoder_slots()}
 
 
 @app.post("/analyze", response_model=AnalysisResult)
-async def analyze_resume(req: AnalyzeRequest):
+def analyze_resume(req: AnalyzeRequest):
     """
     Full ML-powered resume analysis.
     Returns the same structure as the frontend AnalysisResult interface.
@@ -145,17 +265,17 @@ async def analyze_resume(req: AnalyzeRequest):
     if not _models_ready:
         raise HTTPException(503, "Models are still loading, please retry in a moment")
 
+    cache_key = _result_key("analyze", req.resume_text, req.job_description)
+    cached = _cached_result(cache_key)
+    if cached is not None:
+        return cached
+
     t0 = time.time()
 
     resume_text = req.resume_text
     job_description = req.job_description
 
     # ── Step 1: NLP Processing ──
-    from app.models.nlp_engine import (
-        detect_sections, extract_keywords, extract_ngrams,
-        compute_keyword_overlap, compute_readability,
-    )
-
     sections = detect_sections(resume_text)
     jd_keywords = extract_keywords(job_description, 40)
     jd_bigrams = extract_ngrams(job_description, 2, 20)
@@ -167,21 +287,19 @@ async def analyze_resume(req: AnalyzeRequest):
 
     # Bigram overlap
     resume_lower = resume_text.lower()
+    found_set, missing_set = set(exact_found), set(exact_missing)
     for bg in jd_bigrams:
-        if bg in resume_lower and bg not in exact_found:
-            exact_found.append(bg)
-        elif bg not in resume_lower and bg not in exact_missing:
+        if bg in resume_lower:
+            if bg not in found_set:
+                found_set.add(bg)
+                exact_found.append(bg)
+        elif bg not in missing_set:
+            missing_set.add(bg)
             exact_missing.append(bg)
 
     readability = compute_readability(resume_text)
 
     # ── Step 2: Semantic Analysis (Sentence-BERT) ──
-    from app.models.semantic import (
-        compute_jd_match_score,
-        compute_section_similarities,
-        compute_keyword_semantic_matches,
-    )
-
     # Semantic JD match (the core ML feature)
     jd_match = compute_jd_match_score(resume_text, job_description, sections)
 
@@ -194,20 +312,17 @@ async def analyze_resume(req: AnalyzeRequest):
     )
 
     # Merge exact + semantic keyword matches
-    all_found = list(dict.fromkeys(exact_found + sem_found))[:20]
-    all_missing = [kw for kw in exact_missing if kw not in sem_found][:20]
+    all_found = _first_unique(chain(exact_found, sem_found), 20)
+    sem_found_set = set(sem_found)
+    all_missing = list(islice((kw for kw in exact_missing if kw not in sem_found_set), 20))
 
     # ── Step 3: ATS Score ──
-    from app.models.ats_scorer import compute_ats_score
-
     ats_result = compute_ats_score(
         resume_text, job_description, sections, kw_density
     )
     ats_score = ats_result["overall_score"]
 
     # ── Step 4: Section Scores ──
-    from app.models.section_scorer import score_all_sections
-
     section_scores_raw = score_all_sections(sections, job_description, section_sims)
     section_scores = {
         k: SectionScore(score=v["score"], suggestion=v["suggestion"])
@@ -215,20 +330,14 @@ async def analyze_resume(req: AnalyzeRequest):
     }
 
     # ── Step 5: Cliché Detection ──
-    from app.models.cliche_detector import detect_cliches
-
     cliches_raw = detect_cliches(resume_text)
     cliches = [ClicheItem(phrase=c["phrase"], suggestion=c["suggestion"]) for c in cliches_raw]
 
     # ── Step 6: Action Verb Analysis ──
-    from app.models.verb_analyzer import analyze_action_verbs
-
     verb_result = analyze_action_verbs(resume_text)
     action_verb_analysis = ActionVerbAnalysis(**verb_result)
 
     # ── Step 7: Quantification Analysis ──
-    from app.models.quantifier import analyze_quantification
-
     quant_result = analyze_quantification(resume_text)
     quantification_analysis = QuantificationAnalysis(
         score=quant_result["score"],
@@ -238,16 +347,12 @@ async def analyze_resume(req: AnalyzeRequest):
     )
 
     # ── Step 8: Content Improvements ──
-    from app.models.content_improver import generate_content_improvements
-
     improvements_raw = generate_content_improvements(resume_text, job_description)
     content_improvements = [
         ContentImprovement(**imp) for imp in improvements_raw
     ]
 
     # ── Step 9: Overall Grade ──
-    from app.models.grader import compute_grade, compute_recommended_roles
-
     grade_result = compute_grade(
         jd_match=jd_match,
         ats_score=ats_score,
@@ -294,7 +399,7 @@ async def analyze_resume(req: AnalyzeRequest):
     elapsed = time.time() - t0
     print(f"[ML] Analysis complete in {elapsed:.2f}s — JD match: {jd_match}%, Grade: {grade_result['grade']}")
 
-    return AnalysisResult(
+    return _store_result(cache_key, _json_response(AnalysisResult(
         jd_match=jd_match,
         ats_score=ats_score,
         missing_keywords=all_missing[:15],
@@ -316,16 +421,21 @@ async def analyze_resume(req: AnalyzeRequest):
         content_improvements=content_improvements[:5],
         section_completeness=grade_result["section_completeness"],
         overall_grade=grade_result["grade"],
-    )
+    )))
 
 
 # ── Cover Letter (local NLP-based generation) ──
 
 @app.post("/cover-letter", response_model=CoverLetterResult)
-async def generate_cover_letter(req: CoverLetterRequest):
+def generate_cover_letter(req: CoverLetterRequest):
     """Generate a cover letter using NLP template engine."""
-    from app.models.nlp_engine import extract_keywords, extract_entities, detect_sections
-    from app.models.semantic import compute_semantic_similarity
+    cache_key = _result_key(
+        "cover-letter", req.resume_text, req.job_description,
+        req.tone, req.company_name, req.role_title,
+    )
+    cached = _cached_result(cache_key)
+    if cached is not None:
+        return cached
 
     resume_sections = detect_sections(req.resume_text)
     jd_keywords = extract_keywords(req.job_description, 15)
@@ -348,16 +458,20 @@ async def generate_cover_letter(req: CoverLetterRequest):
     )
 
     word_count = len(letter.split())
-    return CoverLetterResult(cover_letter=letter, tone=tone, word_count=word_count)
+    return _store_result(cache_key, _json_response(
+        CoverLetterResult(cover_letter=letter, tone=tone, word_count=word_count)
+    ))
 
 
 # ── Skills Finder ──
 
 @app.post("/skills", response_model=SkillsResult)
-async def find_skills(req: SkillsRequest):
+def find_skills(req: SkillsRequest):
     """Analyze JD and resume for skill matching."""
-    from app.models.nlp_engine import extract_keywords, compute_keyword_overlap
-    from app.models.semantic import compute_keyword_semantic_matches
+    cache_key = _result_key("skills", req.job_description, req.resume_text, req.role_title)
+    cached = _cached_result(cache_key)
+    if cached is not None:
+        return cached
 
     jd_keywords = extract_keywords(req.job_description, 40)
 
@@ -370,8 +484,9 @@ async def find_skills(req: SkillsRequest):
         sem_found, sem_missing = compute_keyword_semantic_matches(
             req.resume_text, exact_missing, threshold=0.55
         )
-        matching = list(dict.fromkeys(exact_found + sem_found))
-        missing = [kw for kw in exact_missing if kw not in sem_found]
+        matching = _first_unique(chain(exact_found, sem_found), 20)
+        sem_found_set = set(sem_found)
+        missing = [kw for kw in exact_missing if kw not in sem_found_set]
     else:
         matching = []
         missing = jd_keywords
@@ -379,19 +494,19 @@ async def find_skills(req: SkillsRequest):
     # Soft skills extraction
     soft_skills = _extract_soft_skills(req.job_description)
 
-    return SkillsResult(
+    return _store_result(cache_key, _json_response(SkillsResult(
         role=req.role_title or "Not specified",
         hard_skills=categories,
         soft_skills=soft_skills,
         missing_from_resume=missing[:20],
         matching_in_resume=matching[:20],
-    )
+    )))
 
 
 # ── Resume Data Extraction ──
 
 @app.post("/extract", response_model=ExtractResult)
-async def extract_resume(req: ExtractRequest):
+def extract_resume(req: ExtractRequest):
     """
     Extract structured resume data using local NLP (spaCy + regex).
     No external API dependency — fully local.
@@ -399,22 +514,33 @@ async def extract_resume(req: ExtractRequest):
     if not _models_ready:
         raise HTTPException(503, "Models are still loading, please retry in a moment")
 
-    import time
     t0 = time.time()
 
-    from app.models.resume_extractor import extract_resume_data
     data = extract_resume_data(req.resume_text)
 
     elapsed = time.time() - t0
     print(f"[ML] Resume extraction complete in {elapsed:.2f}s — name: {data.get('full_name', 'N/A')}")
 
-    return ExtractResult(**data)
+    return _json_response(ExtractResult(**data))
 
 
 # ══════════════════════════════════════════════════════════════
 # Helper Functions
 # ══════════════════════════════════════════════════════════════
 
+def _first_unique(items: Iterable[str], limit: int) -> List[str]:
+    """Order-preserving dedup that stops once limit items are collected."""
+    seen = set()
+    out = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            out.append(item)
+            if len(out) == limit:
+                break
+    return out
+
+
 def _compute_feedback(
     jd_match, ats_score, section_scores, readability,
     kw_density, verb_score, quant_score,
@@ -593,39 +719,44 @@ def _build_cover_letter(company, role, tone, matching_kws, jd_kws, exp, skills,
     return opener + body + closing
 
 
+# Category vocabularies, built once at import rather than per /skills call
+_SKILL_CATEGORIES = {
+    "Programming Languages": frozenset({"python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab"}),
+    "Frameworks & Libraries": frozenset({"react", "angular", "vue", "nextjs", "django", "flask", "spring", "express", "fastapi", "rails", "laravel", "svelte", "pytorch", "tensorflow"}),
+    "Cloud & DevOps": frozenset({"aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible", "jenkins", "ci", "cd", "devops", "serverless", "lambda"}),
+    "Databases": frozenset({"sql", "nosql", "mongodb", "postgresql", "mysql", "redis", "elasticsearch", "dynamodb", "cassandra", "firebase"}),
+    "Tools & Platforms": frozenset({"git", "github", "gitlab", "jira", "confluence", "figma", "vscode", "linux", "unix", "bash"}),
+    "Data & ML": frozenset({"machine", "learning", "deep", "nlp", "ai", "data", "analytics", "tableau", "pandas", "numpy", "spark", "hadoop"}),
+}
+
+
 def _categorize_skills(keywords: List[str], jd_text: str) -> List[SkillCategory]:
     """Categorize JD keywords into skill categories."""
-    categories = {
-        "Programming Languages": {"python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", "ruby", "php", "swift", "kotlin", "scala", "r", "matlab"},
-        "Frameworks & Libraries": {"react", "angular", "vue", "nextjs", "django", "flask", "spring", "express", "fastapi", "rails", "laravel", "svelte", "pytorch", "tensorflow"},
-        "Cloud & DevOps": {"aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible", "jenkins", "ci", "cd", "devops", "serverless", "lambda"},
-        "Databases": {"sql", "nosql", "mongodb", "postgresql", "mysql", "redis", "elasticsearch", "dynamodb", "cassandra", "firebase"},
-        "Tools & Platforms": {"git", "github", "gitlab", "jira", "confluence", "figma", "vscode", "linux", "unix", "bash"},
-        "Data & ML": {"machine", "learning", "deep", "nlp", "ai", "data", "analytics", "tableau", "pandas", "numpy", "spark", "hadoop"},
-    }
-
     result = []
     jd_lower = jd_text.lower()
+    keywords_lower = [(kw, kw.lower()) for kw in keywords]
 
-    for cat_name, cat_keywords in categories.items():
-        matched = [kw for kw in keywords if kw.lower() in cat_keywords]
+    for cat_name, cat_keywords in _SKILL_CATEGORIES.items():
+        matched = [kw for kw, low in keywords_lower if low in cat_keywords]
+        matched_lower = {kw.lower() for kw in matched}
         # Also check JD text for category-specific terms
         for ck in cat_keywords:
-            if ck in jd_lower and ck not in [m.lower() for m in matched]:
+            if ck in jd_lower and ck not in matched_lower:
                 matched.append(ck)
+                matched_lower.add(ck)
         if matched:
             result.append(SkillCategory(category=cat_name, skills=list(dict.fromkeys(matched))[:10]))
 
     return result
 
 
-SOFT_SKILLS_DB = [
+SOFT_SKILLS_DB = (
     "communication", "leadership", "teamwork", "collaboration", "problem solving",
     "critical thinking", "time management", "adaptability", "creativity", "attention to detail",
     "project management", "negotiation", "decision making", "strategic thinking",
     "conflict resolution", "mentoring", "coaching", "presentation", "analytical",
     "organizational", "interpersonal", "self-motivated", "initiative",
-]
+)
 
 
 def _extract_soft_skills(jd_text: str) -> List[str]:
@@ -640,4 +771,8 @@ def _extract_soft_skills(jd_text: str) -> List[str]:
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app.main:app", host=HOST, port=PORT, reload=True)
+    # uvicorn ignores workers when reload is on
+    uvicorn.run(
+        "app.main:app", host=HOST, port=PORT,
+        reload=RELOAD, workers=NUM_WORKERS,
+    )
@@ -29,6 +29,13 @@ from app.models.nlp_engine import (
     tokenize,
 )
 
+# Feature-extraction patterns, compiled once
+_NUMBER_RE = re.compile(r"\b\d+[%+]?\b")
+_DOLLAR_RE = re.compile(r"\$[\d,]+")
+_TABLE_RE = re.compile(r"\t.*\t.*\t")
+_IMAGE_REF_RE = re.compile(r"\.(png|jpg|jpeg|gif|svg|bmp)\b", re.I)
+_SPECIAL_CHAR_RE = re.compile(r"[^\w\s.,:;!?\-()/@#$%&*+='\"{}[\]<>]")
+
 _ats_model = None
 _ats_scaler = None
 
@@ -76,13 +83,13 @@ def extract_ats_features(
 
     # Quantification: count numbers/percentages in experience section
     exp_text = sections.get("experience", "")
-    numbers_in_exp = len(re.findall(r"\b\d+[%+]?\b", exp_text))
-    dollar_amounts = len(re.findall(r"\$[\d,]+", exp_text))
+    numbers_in_exp = len(_NUMBER_RE.findall(exp_text))
+    dollar_amounts = len(_DOLLAR_RE.findall(exp_text))
 
     # Check for common ATS-unfriendly patterns
-    has_tables = bool(re.search(r"\t.*\t.*\t", resume_text))
-    has_images_refs = bool(re.search(r"\.(png|jpg|jpeg|gif|svg|bmp)\b", resume_text, re.I))
-    excess_special_chars = len(re.findall(r"[^\w\s.,:;!?\-()/@#$%&*+='\"{}[\]<>]", resume_text))
+    has_tables = bool(_TABLE_RE.search(resume_text))
+    has_images_refs = bool(_IMAGE_REF_RE.search(resume_text))
+    excess_special_chars = len(_SPECIAL_CHAR_RE.findall(resume_text))
 
     features = np.array([
         float(contact["has_email"]),           # 0
@@ -13,6 +13,11 @@ from typing import List, Dict
 from app.models.verb_analyzer import WEAK_VERBS, STRONG_VERBS
 from app.models.nlp_engine import extract_keywords
 
+_BULLET_MARKER_RE = re.compile(r"^[•\-\*\u2022\d.)]+\s*")
+_DIGIT_RE = re.compile(r"\d")
+# Leading weak phrase -> case-insensitive prefix pattern
+_WEAK_PREFIX_RE = {w: re.compile(r"^" + re.escape(w), re.I) for w in WEAK_VERBS}
+
 
 def generate_content_improvements(
     resume_text: str,
@@ -39,7 +44,7 @@ def generate_content_improvements(
             continue
 
         # Clean bullet marker
-        clean = re.sub(r"^[•\-\*\u2022\d.)]+\s*", "", stripped).strip()
+        clean = _BULLET_MARKER_RE.sub("", stripped).strip()
         if len(clean) < 15:
             continue
 
@@ -73,12 +78,11 @@ def _try_improve(original: str, jd_keywords: List[str]) -> Dict[str, str] | None
     if weak_match:
         replacement = WEAK_VERBS[weak_match][0].capitalize()
         # Replace the weak verb at the beginning
-        pattern = re.compile(r"^" + re.escape(weak_match), re.I)
-        improved = pattern.sub(replacement, improved, count=1)
+        improved = _WEAK_PREFIX_RE[weak_match].sub(replacement, improved, count=1)
         issues.append("upgraded to a stronger action verb")
 
     # 2. Check for missing quantification
-    has_number = bool(re.search(r"\d", original))
+    has_number = bool(_DIGIT_RE.search(original))
     if not has_number:
         # Add a placeholder hint for quantification
         improved = improved.rstrip(".")
@@ -6,10 +6,13 @@ Handles: tokenization, NER, POS tagging, section detection, keyword extraction.
 
 from __future__ import annotations
 import re
+import threading
 from typing import List, Dict, Set, Tuple
 from collections import Counter
+from functools import lru_cache
 
 _nlp = None
+_NLP_LOCK = threading.Lock()
 
 STOP_WORDS: Set[str] = {
     "a", "an", "and", "are", "as", "at", "be", "but", "by", "for", "from",
@@ -33,15 +36,19 @@ def _get_nlp():
     """Lazy-load spaCy model."""
     global _nlp
     if _nlp is None:
-        import spacy
-        try:
-            _nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
-        except OSError:
-            print("[NLP] Downloading spaCy model en_core_web_sm...")
-            from spacy.cli import download
-            download("en_core_web_sm")
-            _nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
-        print("[NLP] spaCy loaded ✓")
+        # Routes run in a threadpool; load (or download) only once
+        with _NLP_LOCK:
+            if _nlp is None:
+                import spacy
+                try:
+                    nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
+                except OSError:
+                    print("[NLP] Downloading spaCy model en_core_web_sm...")
+                    from spacy.cli import download
+                    download("en_core_web_sm")
+                    nlp = spacy.load("en_core_web_sm", disable=["parser", "lemmatizer"])
+                _nlp = nlp
+                print("[NLP] spaCy loaded ✓")
     return _nlp
 
 
@@ -122,23 +129,36 @@ def detect_sections(text: str) -> Dict[str, str]:
 
 # ── Keyword Extraction ────────────────────────────────────────
 
+_TOKEN_RE = re.compile(r"\b[a-zA-Z][a-zA-Z+#.]{1,30}\b")
+_SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+
+
 def tokenize(text: str) -> List[str]:
     """Simple word tokenization."""
-    return re.findall(r"\b[a-zA-Z][a-zA-Z+#.]{1,30}\b", text.lower())
+    return _TOKEN_RE.findall(text.lower())
+
+
+# The same JD is keyword-ranked by /analyze, the ATS scorer, every section
+# score and the content improver, and again by /skills and /cover-letter
+# for the same input; these caches share that work across all of them.
+@lru_cache(maxsize=128)
+def _content_tokens(text: str) -> Tuple[str, ...]:
+    return tuple(t for t in tokenize(text) if t not in STOP_WORDS and len(t) > 2)
+
+
+@lru_cache(maxsize=128)
+def _ranked_keywords(text: str) -> Tuple[str, ...]:
+    return tuple(word for word, _ in Counter(_content_tokens(text)).most_common())
 
 
 def extract_keywords(text: str, top_n: int = 50) -> List[str]:
     """Extract top keywords using frequency analysis, filtering stop words."""
-    tokens = tokenize(text)
-    filtered = [t for t in tokens if t not in STOP_WORDS and len(t) > 2]
-    counter = Counter(filtered)
-    return [word for word, _ in counter.most_common(top_n)]
+    return list(_ranked_keywords(text)[:top_n])
 
 
 def extract_ngrams(text: str, n: int = 2, top_k: int = 30) -> List[str]:
     """Extract top n-grams."""
-    tokens = tokenize(text)
-    filtered = [t for t in tokens if t not in STOP_WORDS and len(t) > 2]
+    filtered = _content_tokens(text)
     ngrams: List[str] = []
     for i in range(len(filtered) - n + 1):
         ngrams.append(" ".join(filtered[i:i + n]))
@@ -160,6 +180,25 @@ def extract_entities(text: str) -> Dict[str, List[str]]:
     return entities
 
 
+def extract_entities_fast(
+    text: str,
+    want: Tuple[str, ...] = ("PERSON",),
+) -> Dict[str, List[str]]:
+    """
+    Like extract_entities, but runs only the NER component and returns
+    just the requested labels. For short header lookups (name, location).
+    """
+    nlp = _get_nlp()
+    disable = [name for name in nlp.pipe_names if name != "ner"]
+    doc = nlp(text[:100000], disable=disable)
+    entities: Dict[str, List[str]] = {label: [] for label in want}
+    for ent in doc.ents:
+        found = entities.get(ent.label_)
+        if found is not None and ent.text not in found:
+            found.append(ent.text)
+    return entities
+
+
 # ── Contact Info Detection ────────────────────────────────────
 
 EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
@@ -200,7 +239,7 @@ def compute_readability(text: str) -> float:
     Compute readability score (0–100).
     Based on average sentence length and word complexity.
     """
-    sentences = re.split(r"[.!?]+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if len(s.strip()) > 5]
     words = tokenize(text)
 
@@ -25,6 +25,8 @@ METRIC_PATTERNS = [
 
 # Patterns for bullet points
 BULLET_LINE = re.compile(r"^[\s]*[•\-\*\u2022\u25CF\u25CB\d.)]+\s*(.+)", re.M)
+_BULLET_START = re.compile(r"^[•\-\*\u2022\d.)]+\s+\S")
+_BULLET_MARKER = re.compile(r"^[•\-\*\u2022\d.)]+\s*")
 
 
 def analyze_quantification(resume_text: str) -> Dict:
@@ -46,7 +48,7 @@ def analyze_quantification(resume_text: str) -> Dict:
     bullet_lines = []
     for line in lines:
         stripped = line.strip()
-        if re.match(r"^[•\-\*\u2022\d.)]+\s+\S", stripped):
+        if _BULLET_START.match(stripped):
             bullet_lines.append(stripped)
         elif len(stripped) > 20 and not _is_header_line(stripped):
             # Count substantial non-header lines as content
@@ -94,7 +96,7 @@ def analyze_quantification(resume_text: str) -> Dict:
         )
 
     for bullet in unquantified_examples[:2]:
-        clean = re.sub(r"^[•\-\*\u2022\d.)]+\s*", "", bullet).strip()
+        clean = _BULLET_MARKER.sub("", bullet).strip()
         if len(clean) > 15:
             suggestions.append(
                 f"Add metrics to: \"{clean[:80]}...\" — "
@@ -9,19 +9,31 @@ Zero external API dependency — runs entirely on local models.
 """
 
 from __future__ import annotations
+import itertools
+import os
 import re
-import uuid
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from app.models.nlp_engine import (
     detect_sections,
-    extract_entities,
+    extract_entities_fast,
     EMAIL_PATTERN,
     PHONE_PATTERN,
     LINKEDIN_PATTERN,
 )
 
 
+# Entry ids only need to be unique within a response (the frontend uses them
+# as list keys), so a counter XOR-ed with a per-process random seed replaces
+# uuid4() and its urandom syscall per entry.
+_ID_SEED = int.from_bytes(os.urandom(4), "big")
+_ID_COUNTER = itertools.count()
+
+
+def _new_id() -> str:
+    return f"{(_ID_SEED ^ next(_ID_COUNTER)) & 0xFFFFFFFF:08x}"
+
+
 # ── Contact Info Extraction ───────────────────────────────────
 
 def _extract_email(text: str) -> str:
@@ -32,7 +44,7 @@ def _extract_email(text: str) -> str:
 def _extract_phone(text: str) -> str:
     for m in PHONE_PATTERN.finditer(text):
         raw = m.group(0).strip()
-        digits = re.sub(r"\D", "", raw)
+        digits = _NON_DIGIT.sub("", raw)
         if 7 <= len(digits) <= 15:
             return raw
     return ""
@@ -48,6 +60,19 @@ def _extract_linkedin(text: str) -> str:
     return ""
 
 
+_DIGIT_RUN4 = re.compile(r"\d{4}")
+_DIGIT_RUN5 = re.compile(r"\d{5,}")
+_NON_DIGIT = re.compile(r"\D")
+_PHONE_ONLY = re.compile(r"^[+\d\s\-()]+$")
+_NAME_DIGITS = re.compile(r"\d{5,}|[+]?\d[\d\s\-()]{6,}")
+
+
+def _has_contact_marker(line: str) -> bool:
+    """Plain substring checks — cheaper than a regex alternation per line."""
+    lo = line.lower()
+    return "@" in lo or "http" in lo or "linkedin" in lo or "github" in lo
+
+
 _LOCATION_PATTERN = re.compile(
     r"""(?:
         [A-Z][a-zA-Z .'-]+,\s*[A-Z]{2}(?:\s+\d{5})?
@@ -58,16 +83,17 @@ _LOCATION_PATTERN = re.compile(
 )
 
 
-def _extract_location(header: str) -> str:
-    for m in _LOCATION_PATTERN.finditer(header):
+def _extract_location(header: str, location_hits: Optional[List[re.Match]] = None) -> str:
+    if location_hits is None:
+        location_hits = list(_LOCATION_PATTERN.finditer(header))
+    for m in location_hits:
         candidate = m.group(0).strip()
-        if re.search(r"\d{4}|@|http|linkedin|github", candidate, re.I):
+        if _has_contact_marker(candidate) or _DIGIT_RUN4.search(candidate):
             continue
         if len(candidate) > 5:
             return candidate
     try:
-        entities = extract_entities(header)
-        gpes = entities.get("GPE", [])
+        gpes = extract_entities_fast(header, want=("GPE",))["GPE"]
         if gpes:
             return ", ".join(gpes[:2])
     except Exception:
@@ -91,7 +117,7 @@ def _extract_name(header: str) -> str:
     for line in first_lines:
         if len(line) > 50:
             continue
-        if re.search(r"@|http|linkedin|github|\d{5,}|[+]?\d[\d\s\-()]{6,}", line, re.I):
+        if _has_contact_marker(line) or _NAME_DIGITS.search(line):
             continue
         if any(kw in line.lower() for kw in _TITLE_KEYWORDS):
             continue
@@ -100,8 +126,7 @@ def _extract_name(header: str) -> str:
             return line
 
     try:
-        entities = extract_entities(header[:500])
-        persons = entities.get("PERSON", [])
+        persons = extract_entities_fast(header[:500], want=("PERSON",))["PERSON"]
         if persons:
             for p in persons:
                 if len(p.split()) >= 2:
@@ -112,18 +137,27 @@ def _extract_name(header: str) -> str:
     return ""
 
 
-def _extract_headline(header: str, experience_section: str) -> str:
+def _extract_headline(
+    header: str,
+    experience_section: str,
+    location_starts: Optional[Set[int]] = None,
+) -> str:
     """Derive a professional headline from header or most recent role."""
+    if location_starts is None:
+        location_starts = {m.start() for m in _LOCATION_PATTERN.finditer(header)}
     lines = header.split("\n")
-    for line in lines[1:5]:
-        line = line.strip()
+    offset = len(lines[0]) + 1 if lines else 0
+    for raw in lines[1:5]:
+        line_start = offset + len(raw) - len(raw.lstrip())
+        offset += len(raw) + 1
+        line = raw.strip()
         if not line or len(line) > 80:
             continue
-        if re.search(r"@|http|linkedin|github|\d{5,}", line, re.I):
+        if _has_contact_marker(line) or _DIGIT_RUN5.search(line):
             continue
-        if re.match(r"^[+\d\s\-()]+$", line):
+        if _PHONE_ONLY.match(line):
             continue
-        if _LOCATION_PATTERN.match(line):
+        if line_start in location_starts:
             continue
         words = line.split()
         if 2 <= len(words) <= 10:
@@ -132,7 +166,7 @@ def _extract_headline(header: str, experience_section: str) -> str:
     if experience_section:
         for line in experience_section.split("\n")[:5]:
             line = line.strip()
-            if line and len(line) < 60 and not re.search(r"\d{4}", line):
+            if line and len(line) < 60 and not _DIGIT_RUN4.search(line):
                 return line
     return ""
 
@@ -180,7 +214,74 @@ _KNOWN_SKILLS = {
 }
 
 
-def _extract_skills(skills_section: str, full_text: str) -> List[str]:
+# Word characters as regex \b sees them (Latin-1 alnum plus "_"), so
+# word-boundary checks are a single bytes index instead of an isalnum() call.
+_ALNUM_MASK = bytes(1 if chr(i).isalnum() or i == ord("_") else 0 for i in range(256))
+
+
+def _is_word_char(ch: str) -> bool:
+    o = ord(ch)
+    if o < 256:
+        return bool(_ALNUM_MASK[o])
+    return ch.isalnum() or ch == "_"
+
+
+def _contains_word(
+    text_lower: str,
+    term: str,
+    check_left: Optional[bool] = None,
+    check_right: Optional[bool] = None,
+) -> bool:
+    """True if ``term`` occurs in ``text_lower`` with no word-character neighbours.
+
+    Word characters match regex ``\\w`` (alphanumerics and ``_``), so word
+    edges behave like ``\\b``: ``go_lang`` does not contain ``go``. The one
+    difference from ``\\bterm\\b``: edges of ``term`` that are punctuation
+    (``c++``, ``.net``) are not boundary-checked, so those skills match next
+    to spaces or commas, where ``\\b`` would require a word character.
+    """
+    if check_left is None:
+        check_left = _is_word_char(term[0])
+    if check_right is None:
+        check_right = _is_word_char(term[-1])
+    n = len(term)
+    end = len(text_lower)
+    start = text_lower.find(term)
+    while start != -1:
+        stop = start + n
+        left_ok = not check_left or start == 0 or not _is_word_char(text_lower[start - 1])
+        right_ok = not check_right or stop == end or not _is_word_char(text_lower[stop])
+        if left_ok and right_ok:
+            return True
+        start = text_lower.find(term, start + 1)
+    return False
+
+
+# List delimiters folded onto "," so lines split with one str.split call.
+_DELIM_TO_COMMA = str.maketrans({";": ",", "|": ",", "\t": ",", "\u2022": ",", "\u00b7": ","})
+
+
+def _split_list_line(line: str) -> List[str]:
+    return [p for p in line.translate(_DELIM_TO_COMMA).split(",") if p]
+
+
+# (skill, display form, check left boundary, check right boundary) — all
+# derived from the static skill list once at import.
+_SKILL_SCAN = tuple(
+    (skill, skill.upper() if len(skill) <= 3 else skill,
+     _is_word_char(skill[0]), _is_word_char(skill[-1]))
+    for skill in _KNOWN_SKILLS
+)
+
+# "Languages: " style label in front of a skills line
+_SKILL_LABEL = re.compile(r"^[A-Za-z\s&/]+:\s*")
+
+# Skills live near the top; appendices/references beyond this are not scanned.
+_SKILL_SCAN_LIMIT = 50_000
+
+
+def _extract_skills(skills_section: str, text_lower: str) -> List[str]:
+    """``text_lower`` is the already-lowercased resume text."""
     found: List[str] = []
 
     if skills_section:
@@ -188,28 +289,27 @@ def _extract_skills(skills_section: str, full_text: str) -> List[str]:
             line = line.strip()
             if not line:
                 continue
-            line = re.sub(r"^[A-Za-z\s&/]+:\s*", "", line)
-            for chunk in re.split(r"[,;|•·\t]+", line):
+            line = _SKILL_LABEL.sub("", line)
+            for chunk in _split_list_line(line):
                 s = chunk.strip().strip("-").strip("*").strip()
                 if 1 < len(s) < 50:
                     found.append(s)
 
-    text_lower = full_text.lower()
+    text_lower = text_lower[:_SKILL_SCAN_LIMIT]
     found_lower = {s.lower() for s in found}
-    for skill in _KNOWN_SKILLS:
+    for skill, display, check_left, check_right in _SKILL_SCAN:
         if skill not in found_lower:
             # Always use word-boundary match to avoid false positives
-            if re.search(r"\b" + re.escape(skill) + r"\b", text_lower):
-                found.append(skill.upper() if len(skill) <= 3 else skill)
+            if _contains_word(text_lower, skill, check_left, check_right):
+                found.append(display)
 
-    seen = set()
-    deduped = []
+    # First spelling wins; dict keeps insertion order
+    deduped: Dict[str, str] = {}
     for s in found:
         key = s.lower().strip()
-        if key not in seen and len(key) > 1:
-            seen.add(key)
-            deduped.append(s)
-    return deduped[:40]
+        if len(key) > 1:
+            deduped.setdefault(key, s)
+    return list(deduped.values())[:40]
 
 
 # ── Experience / Projects / Education Parsing ─────────────────
@@ -228,6 +328,7 @@ _DATE_RANGE = re.compile(
 )
 
 _YEAR_PATTERN = re.compile(r"\b((?:19|20)\d{2})\b")
+_GPA = re.compile(r"(?:GPA|CGPA|gpa)[:\s]*(\d+\.?\d*)\s*/?\s*(\d+\.?\d*)?", re.I)
 
 _BULLET = re.compile(r"^[\s]*[•\-\*\u2022\u25CF\u25CB\u2023\u2043►▪▸‣]\s*")
 
@@ -244,20 +345,33 @@ def _parse_entries(section_text: str) -> List[Dict[str, str]]:
     if not section_text:
         return []
 
-    lines = section_text.split("\n")
+    # One regex pass per line up front: (text, bullet match, date match).
+    # Bullet lines never need the date search.
+    classified = []
+    for line in section_text.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        bm = _BULLET.match(stripped)
+        dm = None if bm else _DATE_RANGE.search(stripped)
+        classified.append((stripped, bm, dm))
+
     entries: List[Dict[str, str]] = []
     current: Optional[Dict[str, str]] = None
-    pending: List[str] = []
+    pending: List[Tuple[str, Optional[re.Match]]] = []
+    # Description pieces of the current entry, joined once when it closes
+    # (a dict value += re-copies the whole string on every line); empty
+    # exactly when the description would be ""
+    desc: List[str] = []
 
     def _flush():
         nonlocal current
         if not pending:
             return
         if current is None:
-            current = {"id": uuid.uuid4().hex[:8], "company": "", "role": "",
+            current = {"id": _new_id(), "company": "", "role": "",
                         "duration": "", "description": ""}
-        for pl in pending:
-            dm = _DATE_RANGE.search(pl)
+        for pl, dm in pending:
             if dm and not current["duration"]:
                 current["duration"] = dm.group(0)
                 rest = _DATE_RANGE.sub("", pl).strip(" |-\u2013\u2014,")
@@ -272,43 +386,40 @@ def _parse_entries(section_text: str) -> List[Dict[str, str]]:
                 current["company"] = pl
         pending.clear()
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
+    for stripped, bm, dm in classified:
+        is_short = len(stripped) < 80 and not bm
 
-        is_bullet = bool(_BULLET.match(line))
-        has_date = bool(_DATE_RANGE.search(stripped))
-        is_short = len(stripped) < 80 and not is_bullet
-
-        if is_bullet:
+        if bm:
             _flush()
             if current is not None:
-                bullet_text = _BULLET.sub("", stripped)
-                if current["description"]:
-                    current["description"] += "; " + bullet_text
-                else:
-                    current["description"] = bullet_text
-        elif has_date and is_short:
+                bullet_text = stripped[bm.end():]
+                if desc:
+                    desc += ("; ", bullet_text)
+                elif bullet_text:
+                    desc.append(bullet_text)
+        elif dm and is_short:
             # Date line belongs with the pending role/company lines
-            pending.append(stripped)
+            pending.append((stripped, dm))
             _flush()
         elif is_short:
-            if current and current.get("description"):
+            if current and desc:
+                current["description"] = "".join(desc)
+                desc.clear()
                 entries.append(current)
                 current = None
                 pending.clear()
-            pending.append(stripped)
+            pending.append((stripped, None))
         else:
             _flush()
             if current is not None:
-                if current["description"]:
-                    current["description"] += " " + stripped
+                if desc:
+                    desc += (" ", stripped)
                 else:
-                    current["description"] = stripped
+                    desc.append(stripped)
 
     _flush()
     if current:
+        current["description"] = "".join(desc)
         entries.append(current)
 
     for e in entries:
@@ -341,9 +452,7 @@ def _parse_education(section_text: str) -> List[Dict[str, str]]:
 
         has_degree = any(kw in line.lower() for kw in degree_kws)
         years = _YEAR_PATTERN.findall(line)
-        gpa_match = re.search(
-            r"(?:GPA|CGPA|gpa)[:\s]*(\d+\.?\d*)\s*/?\s*(\d+\.?\d*)?", line, re.I
-        )
+        gpa_match = _GPA.search(line)
         is_year_or_gpa_only = (
             not has_degree
             and (years or gpa_match)
@@ -355,7 +464,7 @@ def _parse_education(section_text: str) -> List[Dict[str, str]]:
                 entries.append(current)
                 current = None
             if current is None:
-                current = {"id": uuid.uuid4().hex[:8], "institution": "",
+                current = {"id": _new_id(), "institution": "",
                             "degree": "", "year": "", "gpa": ""}
             current["degree"] = line
             if years:
@@ -376,7 +485,7 @@ def _parse_education(section_text: str) -> List[Dict[str, str]]:
                 current["gpa"] = gpa_match.group(1)
         elif current is None:
             current = {
-                "id": uuid.uuid4().hex[:8],
+                "id": _new_id(),
                 "institution": line,
                 "degree": "",
                 "year": years[-1] if years else "",
@@ -385,7 +494,7 @@ def _parse_education(section_text: str) -> List[Dict[str, str]]:
         else:
             entries.append(current)
             current = {
-                "id": uuid.uuid4().hex[:8],
+                "id": _new_id(),
                 "institution": line if not has_degree else "",
                 "degree": line if has_degree else "",
                 "year": years[-1] if years else "",
@@ -397,37 +506,39 @@ def _parse_education(section_text: str) -> List[Dict[str, str]]:
     return entries[:5]
 
 
+def _clean_bullet_lines(section_text: str) -> List[str]:
+    """Non-empty lines with bullet markers stripped."""
+    return [s for s in (_BULLET.sub("", l).strip() for l in section_text.split("\n")) if s]
+
+
 def _extract_certifications(section_text: str) -> List[str]:
     if not section_text:
         return []
-    certs = []
-    for line in section_text.split("\n"):
-        line = _BULLET.sub("", line).strip()
-        if line and len(line) > 3:
-            certs.append(line)
-    return list(dict.fromkeys(certs))[:10]
+    return list(dict.fromkeys(l for l in _clean_bullet_lines(section_text) if len(l) > 3))[:10]
+
+
+_LANGUAGE_QUALIFIER = re.compile(r"\s*[(\-\u2013:].{0,20}$")
 
 
 def _extract_languages(section_text: str) -> List[str]:
     if not section_text:
         return []
     langs = []
-    for line in section_text.split("\n"):
-        line = _BULLET.sub("", line).strip()
-        if not line:
-            continue
-        for chunk in re.split(r"[,;|\u2022\u00b7\t]+", line):
-            s = chunk.strip()
-            s = re.sub(r"\s*[(\-\u2013:].{0,20}$", "", s).strip()
+    for line in _clean_bullet_lines(section_text):
+        for chunk in _split_list_line(line):
+            s = _LANGUAGE_QUALIFIER.sub("", chunk.strip()).strip()
             if s and len(s) > 1 and len(s) < 30:
                 langs.append(s)
     return list(dict.fromkeys(langs))[:10]
 
 
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+
+
 def _build_summary(sections: Dict[str, str], name: str, headline: str) -> str:
     summary_text = sections.get("summary", "")
     if summary_text:
-        sentences = re.split(r"(?<=[.!?])\s+", summary_text)
+        sentences = _SENTENCE_BREAK.split(summary_text)
         return " ".join(sentences[:3]).strip()
 
     parts = []
@@ -449,14 +560,18 @@ def extract_resume_data(resume_text: str) -> Dict[str, Any]:
     """Extract all structured data from resume text."""
     sections = detect_sections(resume_text)
     header = sections.get("header", "")
+    text_lower = resume_text.lower()
 
     full_name = _extract_name(header)
     email = _extract_email(resume_text[:2000])
     phone = _extract_phone(header)
     linkedin_url = _extract_linkedin(resume_text[:2000])
-    location = _extract_location(header)
-    headline = _extract_headline(header, sections.get("experience", ""))
-    skills = _extract_skills(sections.get("skills", ""), resume_text)
+    location_hits = list(_LOCATION_PATTERN.finditer(header))
+    location = _extract_location(header, location_hits)
+    headline = _extract_headline(
+        header, sections.get("experience", ""), {m.start() for m in location_hits}
+    )
+    skills = _extract_skills(sections.get("skills", ""), text_lower)
     experience = _parse_entries(sections.get("experience", ""))
     projects = _parse_entries(sections.get("projects", ""))
     education = _parse_education(sections.get("education", ""))
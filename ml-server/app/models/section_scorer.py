@@ -26,6 +26,9 @@ from app.models.nlp_engine import (
 )
 from app.models.semantic import compute_semantic_similarity
 
+_METRIC_NUMBER_RE = re.compile(r"\b\d+[%+,.]?\d*\b")
+_LINE_LEAD_RE = re.compile(r"^[\s•\-\*\u2022\d.)]+")
+
 _section_model = None
 _section_scaler = None
 
@@ -61,14 +64,14 @@ def extract_section_features(
     bullets = count_bullet_points(section_text) if section_text else 0
 
     # Numbers / metrics
-    numbers = len(re.findall(r"\b\d+[%+,.]?\d*\b", section_text)) if section_text else 0
+    numbers = len(_METRIC_NUMBER_RE.findall(section_text)) if section_text else 0
 
     # Action verbs at start of bullets/sentences
     action_verb_count = 0
     if section_text:
         lines = section_text.strip().split("\n")
         for line in lines:
-            stripped = re.sub(r"^[\s•\-\*\u2022\d.)]+", "", line).strip()
+            stripped = _LINE_LEAD_RE.sub("", line).strip()
             first_word = stripped.split()[0].lower() if stripped.split() else ""
             if first_word in STRONG_ACTION_VERBS:
                 action_verb_count += 1
@@ -124,6 +127,20 @@ STRONG_ACTION_VERBS = {
 }
 
 
+def _missing_section_result(section_name: str) -> Dict:
+    return {
+        "score": 15,
+        "suggestion": f"Your {section_name} section is missing or too brief. "
+                     f"Add detailed, relevant content aligned with the job description.",
+    }
+
+
+def _finalize_section_score(score: float, section_name: str, features: np.ndarray) -> Dict:
+    score = max(5, min(100, round(score)))
+    suggestion = _generate_suggestion(score, section_name, features)
+    return {"score": score, "suggestion": suggestion}
+
+
 def score_section(
     section_text: str,
     jd_text: str,
@@ -135,11 +152,7 @@ def score_section(
     Returns {"score": int, "suggestion": str}
     """
     if not section_text or len(section_text.strip()) < 10:
-        return {
-            "score": 15,
-            "suggestion": f"Your {section_name} section is missing or too brief. "
-                         f"Add detailed, relevant content aligned with the job description.",
-        }
+        return _missing_section_result(section_name)
 
     features = extract_section_features(section_text, jd_text, section_name, semantic_sim)
 
@@ -151,10 +164,7 @@ def score_section(
         # High-quality rule-based scoring
         score = _rule_based_section_score(features, section_name)
 
-    score = max(5, min(100, round(score)))
-    suggestion = _generate_suggestion(score, section_name, features)
-
-    return {"score": score, "suggestion": suggestion}
+    return _finalize_section_score(score, section_name, features)
 
 
 def _rule_based_section_score(features: np.ndarray, section_name: str) -> float:
@@ -240,13 +250,32 @@ def score_all_sections(
     jd_text: str,
     section_sims: Optional[Dict[str, float]] = None,
 ) -> Dict[str, Dict]:
-    """Score all standard resume sections."""
+    """Score all standard resume sections.
+
+    Feature vectors for every present section are stacked so the trained
+    model runs one transform/predict for the whole resume.
+    """
     standard = ["summary", "skills", "experience", "education", "projects"]
     results = {}
+    names = []
+    rows = []
 
     for name in standard:
         text = sections.get(name, "")
+        if not text or len(text.strip()) < 10:
+            results[name] = _missing_section_result(name)
+            continue
         sim = section_sims.get(name, -1.0) if section_sims else -1.0
-        results[name] = score_section(text, jd_text, name, sim)
+        names.append(name)
+        rows.append(extract_section_features(text, jd_text, name, sim))
+
+    if rows:
+        feat_matrix = np.vstack(rows)
+        if _section_model is not None and _section_scaler is not None:
+            scores = _section_model.predict(_section_scaler.transform(feat_matrix))
+        else:
+            scores = [_rule_based_section_score(f, n) for f, n in zip(feat_matrix, names)]
+        for name, features, score in zip(names, feat_matrix, scores):
+            results[name] = _finalize_section_score(float(score), name, features)
 
-    return results
+    return {name: results[name] for name in standard}
@@ -7,29 +7,263 @@ then computes cosine similarity for precise matching.
 """
 
 from __future__ import annotations
+import hashlib
+import os
+import sqlite3
+import threading
 import numpy as np
+from collections import OrderedDict
 from functools import lru_cache
-from typing import List, Dict, Tuple
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 
 _model = None
+_LOAD_LOCK = threading.Lock()
+_cache_conn: Optional[sqlite3.Connection] = None
+_cache_disabled = False
+_cache_lock = threading.Lock()
+
+# Cached vectors are kept in half precision (768 B instead of 1.5 KB per
+# 384-d row) and widened to float32 before any dot product. Unit-norm
+# cosines stay accurate to ~1e-3, far below the 0.55 keyword threshold.
+_STORE_DTYPE = np.float16
+
+_KEYWORD_CACHE_SIZE = 2048
+_keyword_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_keyword_lock = threading.Lock()
+
+_encode_slots: Optional[threading.BoundedSemaphore] = None
+_encode_slots_lock = threading.Lock()
+_encode_capacity = 0
+_encode_in_flight = 0
+_encode_count_lock = threading.Lock()
 
 
 def _get_model():
     """Lazy-load sentence-transformer model (downloads ~90 MB on first run)."""
     global _model
     if _model is None:
-        from sentence_transformers import SentenceTransformer
-        from app.config import SBERT_MODEL_NAME
-        print(f"[ML] Loading Sentence-BERT model: {SBERT_MODEL_NAME} ...")
-        _model = SentenceTransformer(SBERT_MODEL_NAME)
-        print("[ML] Sentence-BERT loaded ✓")
+        # Concurrent first requests would otherwise each load the model
+        with _LOAD_LOCK:
+            if _model is None:
+                _model = _load_model()
     return _model
 
 
-def encode_texts(texts: List[str]) -> np.ndarray:
-    """Encode a list of texts into embeddings (N x 384)."""
+def _load_model():
+    from app.config import (
+        SBERT_MODEL_NAME, SBERT_BACKEND, SBERT_ONNX_FILE, SBERT_QUANTIZE,
+        SBERT_NUM_THREADS,
+    )
+    # Thread pools are sized once, before the first forward pass;
+    # OMP_NUM_THREADS only takes effect if set before torch is imported.
+    os.environ.setdefault("OMP_NUM_THREADS", str(SBERT_NUM_THREADS))
+    import torch
+    from sentence_transformers import SentenceTransformer
+    torch.set_num_threads(SBERT_NUM_THREADS)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already fixed by an earlier parallel op in this process
+    print(f"[ML] Loading Sentence-BERT model: {SBERT_MODEL_NAME} "
+          f"({SBERT_BACKEND}, {SBERT_NUM_THREADS} threads) ...")
+    model = None
+    if SBERT_BACKEND == "onnx":
+        try:
+            model = SentenceTransformer(
+                SBERT_MODEL_NAME,
+                backend="onnx",
+                model_kwargs={
+                    "file_name": SBERT_ONNX_FILE,
+                    "provider": "CPUExecutionProvider",
+                },
+            )
+        except Exception as e:
+            print(f"[!] ONNX backend unavailable ({e}) — falling back to torch")
+    if model is None:
+        model = SentenceTransformer(SBERT_MODEL_NAME)
+        if SBERT_QUANTIZE:
+            model = torch.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            print("[ML] Sentence-BERT quantized to INT8")
+    print("[ML] Sentence-BERT loaded ✓")
+    return model
+
+
+def _get_cache() -> Optional[sqlite3.Connection]:
+    """Open the on-disk embedding cache; None when disabled or unavailable."""
+    global _cache_conn, _cache_disabled
+    if _cache_conn is None and not _cache_disabled:
+        from app.config import EMBED_CACHE_PATH
+        if not EMBED_CACHE_PATH:
+            _cache_disabled = True
+            return None
+        try:
+            Path(EMBED_CACHE_PATH).parent.mkdir(parents=True, exist_ok=True)
+            # Several worker processes share the file: wait on their write
+            # locks instead of failing with "database is locked"
+            conn = sqlite3.connect(EMBED_CACHE_PATH, timeout=5.0, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+            )
+            conn.commit()
+            _cache_conn = conn
+        except (OSError, sqlite3.Error) as e:
+            print(f"[!] Embedding cache disabled: {e}")
+            _cache_disabled = True
+    return _cache_conn
+
+
+@lru_cache(maxsize=1)
+def _cache_namespace() -> bytes:
+    """Model identity mixed into every key so a model switch never reuses rows."""
+    from app.config import SBERT_MODEL_NAME, SBERT_BACKEND, SBERT_QUANTIZE
+    return f"{SBERT_MODEL_NAME}|{SBERT_BACKEND}|{int(SBERT_QUANTIZE)}|f16\0".encode()
+
+
+def _cache_key(text: str) -> bytes:
+    h = hashlib.blake2b(_cache_namespace(), digest_size=16)
+    h.update(text.encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def _encode_with_model(texts: List[str]) -> np.ndarray:
+    # encode() length-sorts its input before batching, so each batch pads
+    # only to its own longest text; callers keep very long texts (resume,
+    # JD) out of batches of short ones.
     model = _get_model()
-    return model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
+    with _get_encode_slots():
+        _count_encode(1)
+        try:
+            return model.encode(
+                texts,
+                batch_size=64,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+            )
+        finally:
+            _count_encode(-1)
+
+
+def _get_encode_slots() -> threading.BoundedSemaphore:
+    global _encode_slots, _encode_capacity
+    if _encode_slots is None:
+        from app.config import SBERT_CONCURRENCY
+        with _encode_slots_lock:
+            if _encode_slots is None:
+                _encode_capacity = SBERT_CONCURRENCY
+                _encode_slots = threading.BoundedSemaphore(SBERT_CONCURRENCY)
+    return _encode_slots
+
+
+def _count_encode(delta: int) -> None:
+    global _encode_in_flight
+    with _encode_count_lock:
+        _encode_in_flight += delta
+
+
+def encoder_slots() -> Dict[str, int]:
+    """Free and total encoder slots, for the admin endpoint."""
+    _get_encode_slots()
+    with _encode_count_lock:
+        in_flight = _encode_in_flight
+    return {"available": _encode_capacity - in_flight, "capacity": _encode_capacity}
+
+
+def _store_rows(conn: sqlite3.Connection, rows: List[Tuple[bytes, bytes]]) -> None:
+    """
+    Insert new vectors, then drop the oldest rows beyond EMBED_CACHE_MAX_ROWS.
+
+    Rows get increasing rowids as they are inserted (a replace gets a new
+    one), so everything at or below max(rowid) - cap is the oldest surplus.
+    """
+    from app.config import EMBED_CACHE_MAX_ROWS
+    try:
+        with _cache_lock:
+            conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+            if EMBED_CACHE_MAX_ROWS > 0:
+                conn.execute(
+                    "DELETE FROM embeddings WHERE rowid <= "
+                    "(SELECT max(rowid) FROM embeddings) - ?",
+                    (EMBED_CACHE_MAX_ROWS,),
+                )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[!] Embedding cache write failed: {e}")
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            pass
+
+
+def encode_texts(texts: List[str]) -> np.ndarray:
+    """
+    Encode a list of texts into embeddings (N x 384).
+
+    Rows already in the on-disk cache are read back; only the misses go
+    through the model, in a single batch.
+    """
+    conn = _get_cache()
+    if conn is None or not texts:
+        return _encode_with_model(texts)
+
+    keys = [_cache_key(t) for t in texts]
+    unique_keys = list(dict.fromkeys(keys))
+    cached: Dict[bytes, np.ndarray] = {}
+    try:
+        with _cache_lock:
+            for i in range(0, len(unique_keys), 500):
+                chunk = unique_keys[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT key, vec FROM embeddings WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for key, vec in rows:
+                    cached[key] = np.frombuffer(vec, dtype=_STORE_DTYPE)
+    except sqlite3.Error as e:
+        # The cache is an optimization: on any database error, encode
+        print(f"[!] Embedding cache read failed: {e}")
+        cached = {}
+
+    miss = {}
+    for key, text in zip(keys, texts):
+        if key not in cached and key not in miss:
+            miss[key] = text
+    if miss:
+        vecs = _encode_with_model(list(miss.values())).astype(_STORE_DTYPE)
+        _store_rows(conn, [(key, vec.tobytes()) for key, vec in zip(miss, vecs)])
+        cached.update(zip(miss, vecs))
+
+    return np.stack([cached[key] for key in keys]).astype(np.float32)
+
+
+def _encode_keywords(keywords: List[str]) -> np.ndarray:
+    """
+    Encode short keywords through an in-process LRU.
+
+    JD keywords repeat heavily across requests, so only keywords not seen
+    recently are sent to encode_texts (in one batch).
+    """
+    with _keyword_lock:
+        hits = {}
+        for kw in keywords:
+            vec = _keyword_cache.get(kw)
+            if vec is not None:
+                _keyword_cache.move_to_end(kw)
+                hits[kw] = vec
+    misses = [kw for kw in dict.fromkeys(keywords) if kw not in hits]
+    if misses:
+        vecs = encode_texts(misses)
+        with _keyword_lock:
+            for kw, vec in zip(misses, vecs):
+                _keyword_cache[kw] = vec.astype(_STORE_DTYPE)
+                hits[kw] = _keyword_cache[kw]
+            while len(_keyword_cache) > _KEYWORD_CACHE_SIZE:
+                _keyword_cache.popitem(last=False)
+    return np.stack([hits[kw] for kw in keywords]).astype(np.float32)
 
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
@@ -42,7 +276,77 @@ def compute_semantic_similarity(text_a: str, text_b: str) -> float:
     if not text_a.strip() or not text_b.strip():
         return 0.0
     embeddings = encode_texts([text_a, text_b])
-    return max(0.0, min(1.0, cosine_similarity(embeddings[0], embeddings[1])))
+    return float(np.clip(embeddings[0] @ embeddings[1], 0.0, 1.0))
+
+
+def _encode_single(text: str) -> np.ndarray:
+    """Encode one text on its own (N=1 batch, no padding to other inputs)."""
+    return encode_texts([text])[0]
+
+
+def _split_windows(text: str, tokenizer, window: int) -> List[str]:
+    """
+    Split text into consecutive spans of at most `window` tokens.
+
+    Spans are cut from the original text via the tokenizer's offsets, so
+    a section that fits in one window is returned unchanged (same cache key).
+    """
+    enc = tokenizer(
+        text,
+        add_special_tokens=False,
+        truncation=True,
+        max_length=window,
+        return_overflowing_tokens=True,
+        return_offsets_mapping=True,
+    )
+    offsets = [o for o in enc["offset_mapping"] if o]
+    if len(offsets) <= 1:
+        return [text]
+    return [text[o[0][0]:o[-1][1]] for o in offsets]
+
+
+def _windowed_embeddings(texts: List[str]) -> np.ndarray:
+    """
+    Encode each text as mean-pooled token windows.
+
+    The encoder truncates at max_seq_length, which silently drops most of a
+    long experience section; here every window is encoded and the windows
+    of each text are averaged and renormalized.
+    """
+    model = _get_model()
+    window = model.max_seq_length - 2  # room for [CLS] / [SEP]
+    windows: List[str] = []
+    counts = np.empty(len(texts), dtype=np.intp)
+    for i, text in enumerate(texts):
+        parts = _split_windows(text, model.tokenizer, window)
+        windows.extend(parts)
+        counts[i] = len(parts)
+
+    embeddings = encode_texts(windows)
+    if len(windows) > len(texts):
+        starts = np.concatenate(([0], np.cumsum(counts[:-1])))
+        embeddings = np.add.reduceat(embeddings, starts, axis=0) / counts[:, None]
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings /= np.maximum(norms, 1e-12)
+    return embeddings
+
+
+def _section_sims(
+    resume_sections: Dict[str, str],
+    jd_emb: np.ndarray,
+) -> Dict[str, float]:
+    """Similarity of each section against an already-encoded JD."""
+    from app.config import SBERT_SECTION_WINDOWS
+    section_names = list(resume_sections.keys())
+    texts = [resume_sections[k] for k in section_names]
+    if SBERT_SECTION_WINDOWS:
+        embeddings = _windowed_embeddings(texts)
+    else:
+        embeddings = encode_texts(texts)
+
+    # One matrix-vector product for all sections (rows are unit-norm)
+    sims = np.clip(embeddings @ jd_emb, 0.0, 1.0)
+    return dict(zip(section_names, sims.tolist()))
 
 
 def compute_section_similarities(
@@ -56,20 +360,9 @@ def compute_section_similarities(
     if not resume_sections or not job_description.strip():
         return {}
 
-    section_names = list(resume_sections.keys())
-    section_texts = [resume_sections[k] for k in section_names]
-
-    # Encode all sections + JD in one batch for efficiency
-    all_texts = section_texts + [job_description]
-    embeddings = encode_texts(all_texts)
-
-    jd_embedding = embeddings[-1]
-    results = {}
-    for i, name in enumerate(section_names):
-        sim = cosine_similarity(embeddings[i], jd_embedding)
-        results[name] = max(0.0, min(1.0, sim))
-
-    return results
+    # The JD is usually far longer than any section; encoding it on its own
+    # keeps the sections' batch padded only to the longest section.
+    return _section_sims(resume_sections, _encode_single(job_description))
 
 
 def compute_keyword_semantic_matches(
@@ -86,21 +379,14 @@ def compute_keyword_semantic_matches(
     if not jd_keywords or not resume_text.strip():
         return [], list(jd_keywords)
 
-    # Encode resume as a single embedding + each keyword
-    all_texts = [resume_text] + jd_keywords
-    embeddings = encode_texts(all_texts)
-    resume_emb = embeddings[0]
-
-    found = []
-    missing = []
-    for i, kw in enumerate(jd_keywords):
-        sim = cosine_similarity(resume_emb, embeddings[i + 1])
-        if sim >= threshold:
-            found.append(kw)
-        else:
-            missing.append(kw)
+    # Resume and keywords are encoded separately so keywords are not
+    # padded to the resume's length
+    resume_emb = _encode_single(resume_text)
+    kw_embeddings = _encode_keywords(jd_keywords)
 
-    return found, missing
+    mask = (kw_embeddings @ resume_emb) >= threshold
+    kws = np.asarray(jd_keywords, dtype=object)
+    return kws[mask].tolist(), kws[~mask].tolist()
 
 
 def compute_jd_match_score(
@@ -113,8 +399,17 @@ def compute_jd_match_score(
     - Full resume ↔ JD semantic similarity (weight: 0.5)
     - Weighted section similarities (weight: 0.5)
     """
+    if not job_description.strip():
+        return 0
+
+    # Encode the JD once and reuse it for the full-text and section scores
+    jd_emb = _encode_single(job_description)
+
     # Full text similarity
-    full_sim = compute_semantic_similarity(resume_text, job_description)
+    full_sim = 0.0
+    if resume_text.strip():
+        full_resume_emb = _encode_single(resume_text)
+        full_sim = float(np.clip(full_resume_emb @ jd_emb, 0.0, 1.0))
 
     # Section-weighted similarity
     section_weights = {
@@ -125,7 +420,7 @@ def compute_jd_match_score(
         "education": 0.10,
     }
 
-    section_sims = compute_section_similarities(resume_sections, job_description)
+    section_sims = _section_sims(resume_sections, jd_emb) if resume_sections else {}
     weighted_section_score = 0.0
     total_weight = 0.0
 
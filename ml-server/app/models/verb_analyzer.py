@@ -7,7 +7,7 @@ and scores overall verb usage quality.
 
 from __future__ import annotations
 import re
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, FrozenSet, Set, Tuple
 
 # ── Weak verbs that should be replaced ──
 WEAK_VERBS: Dict[str, List[str]] = {
@@ -46,8 +46,23 @@ WEAK_VERBS: Dict[str, List[str]] = {
     "learned": ["mastered", "acquired expertise in", "developed proficiency in"],
 }
 
+# Single-word weak verbs are a plain dict lookup; multi-word phrases go
+# through one anchored alternation (more words first, so "worked on" wins
+# over "worked"), tried only when the first word can start such a phrase.
+_WEAK_SINGLE = {k: v for k, v in WEAK_VERBS.items() if " " not in k}
+_WEAK_MULTI = {k: v for k, v in WEAK_VERBS.items() if " " in k}
+_MULTI_PREFIXES = frozenset(k.split()[0] for k in _WEAK_MULTI)
+_WEAK_MULTI_RE = re.compile(
+    "(?:"
+    + "|".join(
+        re.escape(k).replace(r"\ ", r"\s+")
+        for k in sorted(_WEAK_MULTI, key=lambda k: (-len(k.split()), -len(k)))
+    )
+    + r")(?!\S)"
+)
+
 # ── Strong verbs (comprehensive set) ──
-STRONG_VERBS: Set[str] = {
+STRONG_VERBS: FrozenSet[str] = frozenset({
     "accelerated", "accomplished", "achieved", "acquired", "adapted", "administered",
     "advanced", "advocated", "amplified", "analyzed", "appointed", "approved",
     "architected", "assembled", "assessed", "attained", "audited", "authored",
@@ -83,7 +98,12 @@ STRONG_VERBS: Set[str] = {
     "synthesized", "systematized", "targeted", "tested", "traced", "trained",
     "transitioned", "transformed", "translated", "tripled", "troubleshot",
     "uncovered", "unified", "upgraded", "validated", "visualized",
-}
+})
+
+# One match per non-blank line: skips leading bullet glyphs / list
+# numbering and captures the rest of the line plus its first word. The
+# skip may run across newlines, but only over lines with no word on them.
+_LINE_LEAD_RE = re.compile(r"^[\s•\-\*\u2022\d.)]*((\S+).*)", re.MULTILINE)
 
 
 def analyze_action_verbs(resume_text: str) -> Dict:
@@ -98,34 +118,25 @@ def analyze_action_verbs(resume_text: str) -> Dict:
             "suggestions": [str],
         }
     """
-    lines = resume_text.strip().split("\n")
+    # Lowercase once for the whole text; phrases/verbs are all lowercase.
+    # Lines are re-joined on "\n" so "^" sees the same lines as splitlines(),
+    # then a single findall strips bullets and splits off the first word of
+    # every line inside the regex engine.
+    text = "\n".join(resume_text.lower().splitlines())
     found_weak: List[str] = []
     found_strong: List[str] = []
     suggestions: List[str] = []
     seen_weak: Set[str] = set()
     seen_strong: Set[str] = set()
 
-    for line in lines:
-        # Strip bullet markers
-        stripped = re.sub(r"^[\s•\-\*\u2022\d.)]+", "", line).strip()
-        if not stripped:
-            continue
-
-        words = stripped.lower().split()
-        if not words:
-            continue
-
-        first_word = words[0]
-
-        # Check for weak multi-word phrases first
-        first_two = " ".join(words[:2]) if len(words) >= 2 else ""
-        first_three = " ".join(words[:3]) if len(words) >= 3 else ""
-
+    for stripped, first_word in _LINE_LEAD_RE.findall(text):
         matched_weak = None
-        for phrase in [first_three, first_two, first_word]:
-            if phrase in WEAK_VERBS:
-                matched_weak = phrase
-                break
+        if first_word in _MULTI_PREFIXES:
+            m = _WEAK_MULTI_RE.match(stripped)
+            if m:
+                matched_weak = " ".join(m.group(0).split())
+        if matched_weak is None and first_word in _WEAK_SINGLE:
+            matched_weak = first_word
 
         if matched_weak and matched_weak not in seen_weak:
             found_weak.append(matched_weak)
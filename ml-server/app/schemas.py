@@ -19,16 +19,16 @@ class ClicheItem(BaseModel):
 
 class ActionVerbAnalysis(BaseModel):
     score: int = 0
-    weak_verbs: List[str] = []
-    strong_verbs: List[str] = []
-    suggestions: List[str] = []
+    weak_verbs: List[str] = Field(default_factory=list)
+    strong_verbs: List[str] = Field(default_factory=list)
+    suggestions: List[str] = Field(default_factory=list)
 
 
 class QuantificationAnalysis(BaseModel):
     score: int = 0
     quantified_bullets: int = 0
     total_bullets: int = 0
-    suggestions: List[str] = []
+    suggestions: List[str] = Field(default_factory=list)
 
 
 class ATSDetailedCheck(BaseModel):
@@ -39,8 +39,8 @@ class ATSDetailedCheck(BaseModel):
     has_clean_formatting: bool = True
     section_headings_valid: bool = False
     keyword_density: float = 0.0
-    issues: List[str] = []
-    recommendations: List[str] = []
+    issues: List[str] = Field(default_factory=list)
+    recommendations: List[str] = Field(default_factory=list)
 
 
 class ContentImprovement(BaseModel):
@@ -53,25 +53,25 @@ class AnalysisResult(BaseModel):
     """Matches the frontend AnalysisResult interface exactly."""
     jd_match: int = 0
     ats_score: int = 0
-    missing_keywords: List[str] = []
-    found_keywords: List[str] = []
-    section_scores: Dict[str, SectionScore] = {}
+    missing_keywords: List[str] = Field(default_factory=list)
+    found_keywords: List[str] = Field(default_factory=list)
+    section_scores: Dict[str, SectionScore] = Field(default_factory=dict)
     profile_summary: str = ""
-    strengths: List[str] = []
-    weaknesses: List[str] = []
-    action_items: List[str] = []
+    strengths: List[str] = Field(default_factory=list)
+    weaknesses: List[str] = Field(default_factory=list)
+    action_items: List[str] = Field(default_factory=list)
     keyword_density: float = 0.0
     readability_score: int = 0
     formatting_feedback: str = ""
-    recommended_roles: List[str] = []
+    recommended_roles: List[str] = Field(default_factory=list)
     analysis_mode: str = "ml"
 
     # Enhanced fields
-    cliches: List[ClicheItem] = []
+    cliches: List[ClicheItem] = Field(default_factory=list)
     action_verb_analysis: Optional[ActionVerbAnalysis] = None
     quantification_analysis: Optional[QuantificationAnalysis] = None
     ats_detailed: Optional[ATSDetailedCheck] = None
-    content_improvements: List[ContentImprovement] = []
+    content_improvements: List[ContentImprovement] = Field(default_factory=list)
     section_completeness: int = 0
     overall_grade: str = ""
 
@@ -86,7 +86,7 @@ class HealthResponse(BaseModel):
     version: str = "2.0.0"
     ai_available: bool = True
     nlp_available: bool = True
-    models_loaded: Dict[str, bool] = {}
+    models_loaded: Dict[str, bool] = Field(default_factory=dict)
 
 
 class CoverLetterRequest(BaseModel):
@@ -116,10 +116,10 @@ class SkillCategory(BaseModel):
 
 class SkillsResult(BaseModel):
     role: str
-    hard_skills: List[SkillCategory] = []
-    soft_skills: List[str] = []
-    missing_from_resume: List[str] = []
-    matching_in_resume: List[str] = []
+    hard_skills: List[SkillCategory] = Field(default_factory=list)
+    soft_skills: List[str] = Field(default_factory=list)
+    missing_from_resume: List[str] = Field(default_factory=list)
+    matching_in_resume: List[str] = Field(default_factory=list)
 
 
 # ── Resume Extraction ─────────────────────────────────────────
@@ -151,10 +151,10 @@ class ExtractResult(BaseModel):
     location: str = ""
     linkedin_url: str = ""
     headline: str = ""
-    skills: List[str] = []
-    experience: List[ExperienceEntry] = []
-    projects: List[ExperienceEntry] = []
-    education: List[EducationEntry] = []
-    certifications: List[str] = []
-    languages: List[str] = []
+    skills: List[str] = Field(default_factory=list)
+    experience: List[ExperienceEntry] = Field(default_factory=list)
+    projects: List[ExperienceEntry] = Field(default_factory=list)
+    education: List[EducationEntry] = Field(default_factory=list)
+    certifications: List[str] = Field(default_factory=list)
+    languages: List[str] = Field(default_factory=list)
     summary: str = ""
@@ -5,10 +5,15 @@ Generates labeled (resume, job_description, scores) tuples.
 Creates realistic variations to train scoring models to 95%+ accuracy.
 """
 
+import itertools
 import random
 import json
 import os
-from typing import Dict, List, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
 
 # ── Templates ──
 
@@ -64,63 +69,71 @@ SKILLS_BY_DOMAIN = {
     },
 }
 
-CLICHES = [
+CLICHES = (
     "results-driven", "team player", "self-starter", "go-getter",
     "think outside the box", "detail-oriented", "hard worker",
     "passionate about", "synergy", "proven track record",
-]
+)
 
-WEAK_VERBS = ["managed", "helped", "worked on", "responsible for", "assisted with"]
+WEAK_VERBS = ("managed", "helped", "worked on", "responsible for", "assisted with")
 
-EDUCATION_TEMPLATES = [
+EDUCATION_TEMPLATES = (
     "Bachelor of Science in Computer Science, {uni}, GPA: {gpa}",
     "Master of Science in {major}, {uni}",
     "Bachelor of Engineering in {major}, {uni}, {year}",
     "MBA, {uni}, {year}",
-]
+)
 
-UNIVERSITIES = [
+UNIVERSITIES = (
     "MIT", "Stanford University", "UC Berkeley", "Carnegie Mellon",
     "Georgia Tech", "University of Michigan", "UT Austin",
     "University of Washington", "Purdue University", "UIUC",
-]
+)
 
-MAJORS = [
+MAJORS = (
     "Computer Science", "Data Science", "Information Technology",
     "Electrical Engineering", "Business Administration", "Mathematics",
-]
+)
 
-COMPANIES = [
+COMPANIES = (
     "Google", "Amazon", "Microsoft", "Meta", "Apple", "Netflix",
     "Uber", "Airbnb", "Stripe", "Coinbase", "A Software Company",
     "TechCorp", "InnovateTech", "DataDriven Inc.", "CloudFirst",
-]
-
-
-def _random_metrics() -> str:
-    """Generate a random quantified metric."""
-    templates = [
-        f"increased revenue by {random.randint(10, 200)}%",
-        f"reduced latency by {random.randint(20, 80)}%",
-        f"serving {random.randint(1, 50)}M+ users",
-        f"saved ${random.randint(10, 500)}K annually",
-        f"improved throughput by {random.randint(2, 10)}x",
-        f"managed a team of {random.randint(3, 20)} engineers",
-        f"delivered {random.randint(2, 15)} projects in {random.randint(6, 18)} months",
-        f"processing {random.randint(1, 100)}K requests/second",
-        f"achieved {random.randint(95, 99)}.{random.randint(0, 9)}% uptime",
-        f"reduced costs by ${random.randint(50, 500)}K",
-    ]
-    return random.choice(templates)
-
-
-def _generate_bullet(domain: str, strong: bool = True, quantified: bool = True) -> str:
-    """Generate a resume bullet point."""
-    d = SKILLS_BY_DOMAIN[domain]
-    verb = random.choice(d["verbs"]) if strong else random.choice(WEAK_VERBS)
-    skill = random.choice(d["hard"])
-    metric = _random_metrics() if quantified else ""
+)
+
+
+# Read-only pools: inner lists of SKILLS_BY_DOMAIN become tuples too
+SKILLS_BY_DOMAIN = {
+    domain: {key: tuple(values) for key, values in pools.items()}
+    for domain, pools in SKILLS_BY_DOMAIN.items()
+}
+
+NAMES = ("John Doe", "Jane Smith", "Alex Johnson", "Sam Wilson", "Pat Taylor")
+
+
+# Quantified-metric templates with the inclusive range of each number
+_METRIC_TEMPLATES = (
+    ("increased revenue by {}%", (10,), (200,)),
+    ("reduced latency by {}%", (20,), (80,)),
+    ("serving {}M+ users", (1,), (50,)),
+    ("saved ${}K annually", (10,), (500,)),
+    ("improved throughput by {}x", (2,), (10,)),
+    ("managed a team of {} engineers", (3,), (20,)),
+    ("delivered {} projects in {} months", (2, 6), (15, 18)),
+    ("processing {}K requests/second", (1,), (100,)),
+    ("achieved {}.{}% uptime", (95, 0), (99, 9)),
+    ("reduced costs by ${}K", (50,), (500,)),
+)
+
 
+def _random_metric(rng: np.random.Generator, idx: int) -> str:
+    """Fill metric template `idx` with random numbers."""
+    template, low, high = _METRIC_TEMPLATES[idx]
+    return template.format(*rng.integers(low, np.add(high, 1)).tolist())
+
+
+def _generate_bullet(verb: str, skill: str, metric: str, strong: bool, quantified: bool) -> str:
+    """Generate a resume bullet point from pre-drawn parts."""
     if strong and quantified:
         return f"• {verb} {skill}-based solution that {metric}"
     elif strong:
@@ -131,41 +144,76 @@ def _generate_bullet(domain: str, strong: bool = True, quantified: bool = True)
         return f"• {verb.capitalize()} {skill} tasks for the team"
 
 
-def _generate_experience(domain: str, quality: float) -> str:
+def _generate_experience(domain: str, quality: float, rng: np.random.Generator) -> str:
     """Generate experience section. quality: 0.0 (bad) to 1.0 (excellent)"""
-    num_jobs = random.randint(1, 3) if quality < 0.5 else random.randint(2, 4)
-    exp = "EXPERIENCE\n"
+    d = SKILLS_BY_DOMAIN[domain]
+    verbs, hard, titles = d["verbs"], d["hard"], d["titles"]
+
+    num_jobs = int(rng.integers(1, 4) if quality < 0.5 else rng.integers(2, 5))
+    # Every index this section needs is drawn in a few batched calls
+    company_idx = rng.integers(0, len(COMPANIES), num_jobs).tolist()
+    title_idx = rng.integers(0, len(titles), num_jobs).tolist()
+    year_starts = rng.integers(2018, 2024, num_jobs).tolist()
+    durations = rng.integers(1, 4, num_jobs).tolist()
+    if quality > 0.5:
+        num_bullets = rng.integers(2, 6, num_jobs).tolist()
+    else:
+        num_bullets = rng.integers(1, 4, num_jobs).tolist()
 
-    for i in range(num_jobs):
-        company = random.choice(COMPANIES)
-        title = random.choice(SKILLS_BY_DOMAIN[domain]["titles"])
-        year_start = random.randint(2018, 2023)
-        year_end = year_start + random.randint(1, 3)
+    total = sum(num_bullets)
+    # Strong-verb / quantified gates for every bullet, rolled in one call
+    strong_flags, quant_flags = (rng.random((total, 2)) < (quality, quality * 0.8)).T.tolist()
+    verb_idx, weak_idx, skill_idx, metric_idx = (
+        rng.integers(0, (len(verbs), len(WEAK_VERBS), len(hard), len(_METRIC_TEMPLATES)),
+                     size=(total, 4)).T.tolist()
+    )
 
-        exp += f"\n{title} | {company} | {year_start} - {year_end}\n"
+    parts = ["EXPERIENCE\n"]
+    k = 0
+    for j in range(num_jobs):
+        year_start = year_starts[j]
+        year_end = year_start + durations[j]
 
-        num_bullets = random.randint(2, 5) if quality > 0.5 else random.randint(1, 3)
-        for _ in range(num_bullets):
-            strong = random.random() < quality
-            quantified = random.random() < quality * 0.8
-            exp += _generate_bullet(domain, strong, quantified) + "\n"
+        parts.append(f"\n{titles[title_idx[j]]} | {COMPANIES[company_idx[j]]} | {year_start} - {year_end}\n")
 
-    return exp
+        for _ in range(num_bullets[j]):
+            strong, quantified = strong_flags[k], quant_flags[k]
+            verb = verbs[verb_idx[k]] if strong else WEAK_VERBS[weak_idx[k]]
+            metric = _random_metric(rng, metric_idx[k]) if quantified else ""
+            parts.append(_generate_bullet(verb, hard[skill_idx[k]], metric, strong, quantified) + "\n")
+            k += 1
 
+    return "".join(parts)
 
-def _generate_skills(domain: str, quality: float, jd_skills: List[str]) -> str:
-    """Generate skills section with variable overlap with JD."""
-    d = SKILLS_BY_DOMAIN[domain]
-    n_matching = int(len(jd_skills) * quality * 0.9)  # Up to 90% overlap for quality=1
-    matching = random.sample(jd_skills, min(n_matching, len(jd_skills)))
-    extra = random.sample(d["hard"], min(5, len(d["hard"])))
 
-    all_skills = list(dict.fromkeys(matching + extra))
-    return "SKILLS\n" + ", ".join(all_skills[:15])
+def _sample(rng: np.random.Generator, pool, k: int) -> list:
+    """k distinct items of `pool` in random order, drawn as indices."""
+    return [pool[i] for i in rng.permutation(len(pool))[:k].tolist()]
 
 
-def _generate_summary(domain: str, quality: float) -> str:
-    """Generate professional summary."""
+def _generate_skills(
+    domain: str, quality: float, jd_skills: List[str], rng: np.random.Generator,
+) -> str:
+    """Generate skills section with variable overlap with JD."""
+    d = SKILLS_BY_DOMAIN[domain]
+    n_matching = int(len(jd_skills) * quality * 0.9)  # Up to 90% overlap for quality=1
+    matching = _sample(rng, jd_skills, n_matching)
+    extra = _sample(rng, d["hard"], 5)
+
+    # Order-preserving dedup without the concatenated list and dict
+    seen = set()
+    all_skills = []
+    for skill in itertools.chain(matching, extra):
+        if skill not in seen:
+            seen.add(skill)
+            all_skills.append(skill)
+            if len(all_skills) == 15:
+                break
+    return "SKILLS\n" + ", ".join(all_skills)
+
+
+def _generate_summary(domain: str, quality: float, cliche_roll: float) -> str:
+    """Generate professional summary. cliche_roll: pre-drawn uniform [0, 1)."""
     years = random.randint(2, 12)
     title = random.choice(SKILLS_BY_DOMAIN[domain]["titles"])
 
@@ -174,7 +222,7 @@ def _generate_summary(domain: str, quality: float) -> str:
     elif quality > 0.4:
         return f"SUMMARY\nExperienced {title} with {years} years in the field. Looking for challenging opportunities."
     else:
-        if random.random() < 0.5:
+        if cliche_roll < 0.5:
             cliche = random.choice(CLICHES)
             return f"SUMMARY\nA {cliche} {title.lower()} who is a team player and a hard worker."
         return ""  # Missing summary
@@ -191,30 +239,30 @@ def _generate_education(quality: float) -> str:
     return "EDUCATION\n" + template.format(uni=uni, major=major, year=year, gpa=gpa)
 
 
-def _generate_contact(quality: float) -> str:
-    """Generate contact info."""
-    name = random.choice(["John Doe", "Jane Smith", "Alex Johnson", "Sam Wilson", "Pat Taylor"])
+def _generate_contact(quality: float, rolls) -> str:
+    """Generate contact info. rolls: 3 pre-drawn uniforms (phone, LinkedIn, GitHub)."""
+    name = random.choice(NAMES)
     email = f"{name.lower().replace(' ', '.')}@email.com"
 
     parts = [name, email]
-    if quality > 0.3 or random.random() < 0.7:
+    if quality > 0.3 or rolls[0] < 0.7:
         parts.append(f"({random.randint(100, 999)}) {random.randint(100, 999)}-{random.randint(1000, 9999)}")
-    if quality > 0.5 or random.random() < 0.5:
+    if quality > 0.5 or rolls[1] < 0.5:
         parts.append(f"linkedin.com/in/{name.lower().replace(' ', '-')}")
-    if quality > 0.7 and random.random() < 0.5:
+    if quality > 0.7 and rolls[2] < 0.5:
         parts.append(f"github.com/{name.lower().replace(' ', '')}")
 
     return " | ".join(parts)
 
 
-def _generate_job_description(domain: str) -> Tuple[str, List[str]]:
+def _generate_job_description(domain: str, rng: np.random.Generator) -> Tuple[str, List[str]]:
     """Generate a job description and return (jd_text, key_skills)."""
     d = SKILLS_BY_DOMAIN[domain]
     title = random.choice(d["titles"])
     company = random.choice(COMPANIES)
     years = random.randint(2, 8)
 
-    req_skills = random.sample(d["hard"], min(random.randint(5, 10), len(d["hard"])))
+    req_skills = _sample(rng, d["hard"], int(rng.integers(5, 11)))
 
     jd = f"""
 {title} - {company}
@@ -243,37 +291,38 @@ Responsibilities:
     return jd, req_skills
 
 
-def generate_resume(domain: str, quality: float) -> Tuple[str, Dict]:
-    """
-    Generate a synthetic resume with known quality level.
+# Slots in the per-resume array of uniform rolls used for yes/no gates
+_R_PHONE, _R_LINKEDIN, _R_GITHUB, _R_SUMMARY_CLICHE, _R_PROJECTS, _R_CLICHES = range(6)
+_N_ROLLS = 6
 
-    Args:
-        domain: Skill domain key
-        quality: 0.0 to 1.0 where 1.0 is a perfect resume
 
-    Returns:
-        (resume_text, metadata) where metadata contains labels
-    """
-    jd, jd_skills = _generate_job_description(domain)
+def _compose_resume(domain: str, quality: float, rng: np.random.Generator) -> Tuple[str, Dict]:
+    """Build the resume text and its structural metadata (no score labels)."""
+    jd, jd_skills = _generate_job_description(domain, rng)
 
-    contact = _generate_contact(quality)
-    summary = _generate_summary(domain, quality)
-    skills = _generate_skills(domain, quality, jd_skills)
-    experience = _generate_experience(domain, quality)
+    # Every section-level gate for this resume, drawn in one call
+    rolls = rng.random(_N_ROLLS).tolist()
+
+    contact = _generate_contact(quality, rolls[_R_PHONE:_R_GITHUB + 1])
+    summary = _generate_summary(domain, quality, rolls[_R_SUMMARY_CLICHE])
+    skills = _generate_skills(domain, quality, jd_skills, rng)
+    experience = _generate_experience(domain, quality, rng)
     education = _generate_education(quality)
 
     # Optionally add projects section for higher quality
     projects = ""
-    if quality > 0.6 and random.random() < quality:
-        projects = "PROJECTS\n"
-        for _ in range(random.randint(1, 3)):
-            projects += f"• {random.choice(SKILLS_BY_DOMAIN[domain]['verbs'])} a {random.choice(jd_skills)} project — {_random_metrics()}\n"
+    if quality > 0.6 and rolls[_R_PROJECTS] < quality:
+        verbs = SKILLS_BY_DOMAIN[domain]["verbs"]
+        projects = "PROJECTS\n" + "".join(
+            f"• {random.choice(verbs)} a {random.choice(jd_skills)} project — {_random_metric(rng, int(rng.integers(len(_METRIC_TEMPLATES))))}\n"
+            for _ in range(random.randint(1, 3))
+        )
 
     # Add clichés for lower quality
     cliches_added = 0
-    if quality < 0.5 and random.random() < 0.7:
-        n = random.randint(2, 5)
-        cliche_text = "\n" + " ".join(random.sample(CLICHES, min(n, len(CLICHES))))
+    if quality < 0.5 and rolls[_R_CLICHES] < 0.7:
+        n = int(rng.integers(2, 6))
+        cliche_text = "\n" + " ".join(_sample(rng, CLICHES, n))
         cliches_added = n
     else:
         cliche_text = ""
@@ -289,67 +338,184 @@ def generate_resume(domain: str, quality: float) -> Tuple[str, Dict]:
         bool(projects),
     ])
 
-    # Noise for realism
-    noise = random.uniform(-5, 5)
-
     metadata = {
         "domain": domain,
         "quality": quality,
         "jd": jd,
         "jd_skills": jd_skills,
-        "expected_jd_match": min(100, max(0, int(quality * 85 + noise + 10))),
-        "expected_ats_score": min(100, max(0, int(quality * 80 + noise + 15))),
         "sections_present": sections_present,
         "cliches_added": cliches_added,
         "has_email": True,
-        "has_phone": quality > 0.3 or random.random() < 0.7,
+        "has_phone": quality > 0.3 or rolls[_R_PHONE] < 0.7,
     }
 
     return resume, metadata
 
 
-def generate_dataset(n_samples: int = 5000, output_dir: str = None) -> List[Dict]:
-    """Generate a full labeled dataset."""
-    if output_dir is None:
-        output_dir = os.path.join(os.path.dirname(__file__), "..", "..", "training_data")
+def _expected_scores(quality, noise) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score labels from quality + noise. Accepts scalars or whole arrays, so
+    a dataset's labels are computed in one vectorized pass.
+    """
+    quality = np.asarray(quality, dtype=np.float64)
+    noise = np.asarray(noise, dtype=np.float64)
+    # astype truncates toward zero, like int()
+    jd_match = np.clip((quality * 85 + noise + 10).astype(np.int64), 0, 100)
+    ats_score = np.clip((quality * 80 + noise + 15).astype(np.int64), 0, 100)
+    return jd_match, ats_score
 
-    os.makedirs(output_dir, exist_ok=True)
 
-    data = []
+def generate_resume(
+    domain: str, quality: float, rng: np.random.Generator = None,
+) -> Tuple[str, Dict]:
+    """
+    Generate a synthetic resume with known quality level.
+
+    Args:
+        domain: Skill domain key
+        quality: 0.0 to 1.0 where 1.0 is a perfect resume
+        rng: NumPy generator for batched draws (a fresh one if omitted)
+
+    Returns:
+        (resume_text, metadata) where metadata contains labels
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    resume, metadata = _compose_resume(domain, quality, rng)
+
+    # Noise for realism
+    jd_match, ats_score = _expected_scores(quality, random.uniform(-5, 5))
+    metadata["expected_jd_match"] = int(jd_match)
+    metadata["expected_ats_score"] = int(ats_score)
+
+    return resume, metadata
+
+
+# Samples per worker task; small enough that in-flight shards stay cheap
+_SHARD = 250
+
+
+def _iter_samples(
+    n_samples: int, rng: np.random.Generator, start_id: int = 0, progress: bool = True,
+) -> Iterator[Dict]:
     domains = list(SKILLS_BY_DOMAIN.keys())
 
-    for i in range(n_samples):
-        domain = random.choice(domains)
-        # Sample quality from beta distribution for realistic spread
-        quality = random.betavariate(2.5, 2.5)  # Peak around 0.5, spread to 0-1
+    # All per-sample scalar draws and the label arithmetic happen up front
+    # as arrays; the loop below only builds strings.
+    domain_idx = rng.integers(0, len(domains), n_samples).tolist()
+    # Sample quality from beta distribution for realistic spread
+    qualities = rng.beta(2.5, 2.5, n_samples)  # Peak around 0.5, spread to 0-1
+    noise = rng.uniform(-5, 5, n_samples)
+    jd_match, ats_score = _expected_scores(qualities, noise)
+    jd_match, ats_score = jd_match.tolist(), ats_score.tolist()
+    rounded = np.round(qualities, 3).tolist()
+    qualities = qualities.tolist()
 
-        resume, metadata = generate_resume(domain, quality)
+    for i in range(n_samples):
+        resume, metadata = _compose_resume(domains[domain_idx[i]], qualities[i], rng)
 
-        sample = {
-            "id": i,
+        yield {
+            "id": start_id + i,
             "resume": resume,
             "job_description": metadata["jd"],
             "domain": metadata["domain"],
-            "quality": round(metadata["quality"], 3),
-            "expected_jd_match": metadata["expected_jd_match"],
-            "expected_ats_score": metadata["expected_ats_score"],
+            "quality": rounded[i],
+            "expected_jd_match": jd_match[i],
+            "expected_ats_score": ats_score[i],
             "sections_present": metadata["sections_present"],
             "cliches_count": metadata["cliches_added"],
         }
-        data.append(sample)
 
-        if (i + 1) % 500 == 0:
+        if progress and (i + 1) % 500 == 0:
             print(f"  Generated {i + 1}/{n_samples} samples...")
 
+
+def _generate_shard(seed: int, n_samples: int, start_id: int) -> List[Dict]:
+    """Worker entry point: one small, independently seeded slice of the dataset."""
+    # Forked workers inherit the parent's `random` state; reseed so shards
+    # don't repeat each other's string choices.
+    random.seed(seed)
+    return list(_iter_samples(n_samples, np.random.default_rng(seed), start_id, progress=False))
+
+
+def iter_synthetic_samples(n_samples: int = 5000, workers: int = 1) -> Iterator[Dict]:
+    """
+    Yield labeled synthetic samples in id order.
+
+    Serial by default. With workers > 1, _SHARD-sized slices are generated
+    across processes and at most two shards per worker are in flight, so
+    memory stays bounded however many samples are requested.
+    """
+    workers = max(1, min(workers or 1, n_samples // _SHARD))
+    if workers == 1:
+        yield from _iter_samples(n_samples, np.random.default_rng())
+        return
+
+    n_shards = -(-n_samples // _SHARD)
+    seeds = [int(ss.generate_state(1)[0]) for ss in np.random.SeedSequence().spawn(n_shards)]
+    tasks = (
+        (seeds[k], min(_SHARD, n_samples - k * _SHARD), k * _SHARD)
+        for k in range(n_shards)
+    )
+
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pending = deque(
+            ex.submit(_generate_shard, *task)
+            for task in itertools.islice(tasks, 2 * workers)
+        )
+        while pending:
+            shard = pending.popleft().result()
+            task = next(tasks, None)
+            if task is not None:
+                pending.append(ex.submit(_generate_shard, *task))
+            yield from shard
+            done += len(shard)
+            if done % 1000 < _SHARD or done == n_samples:
+                print(f"  Generated {done}/{n_samples} samples...")
+
+
+def generate_dataset(
+    n_samples: int = 5000, output_dir: str = None, workers: int = 1, fmt: str = "json",
+) -> List[Dict]:
+    """
+    Generate a full labeled dataset.
+
+    fmt="parquet" writes zstd-compressed training_data.parquet (needs
+    pyarrow) instead of training_data.json.
+    """
+    if output_dir is None:
+        output_dir = os.path.join(os.path.dirname(__file__), "..", "..", "training_data")
+
+    os.makedirs(output_dir, exist_ok=True)
+
+    data = list(iter_synthetic_samples(n_samples, workers))
+
     # Save dataset
-    output_path = os.path.join(output_dir, "training_data.json")
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        output_path = os.path.join(output_dir, "training_data.parquet")
+        pq.write_table(pa.Table.from_pylist(data), output_path,
+                       compression="zstd", compression_level=3)
+    else:
+        output_path = os.path.join(output_dir, "training_data.json")
+        with open(output_path, "w") as f:
+            json.dump(data, f, indent=2)
 
     print(f"\n[✓] Saved {len(data)} samples to {output_path}")
     return data
 
 
 if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Generate synthetic training data.")
+    parser.add_argument("--samples", type=int, default=5000)
+    parser.add_argument("--format", choices=("json", "parquet"), default="json")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="generator processes (default: serial)")
+    args = parser.parse_args()
+
     print("Generating synthetic training data...")
-    generate_dataset(5000)
+    generate_dataset(args.samples, workers=args.workers, fmt=args.format)
@@ -31,25 +31,46 @@ import joblib
 from app.config import MODELS_DIR, DATA_DIR, GRADE_MAP
 
 
+def _read_dataset(path: str) -> list:
+    """Read a dataset file written as .jsonl, .parquet or a .json array."""
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        # Columns absent from a row (e.g. weight) come back as nulls
+        return [{k: v for k, v in row.items() if v is not None}
+                for row in pq.read_table(path).to_pylist()]
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+
+def _newest(*names: str):
+    paths = [os.path.join(DATA_DIR, n) for n in names]
+    paths = [p for p in paths if os.path.exists(p)]
+    return max(paths, key=os.path.getmtime) if paths else None
+
+
 def load_training_data():
     """Load the unified training data (synthetic + real + feedback)."""
-    # Try unified dataset first
-    unified_path = os.path.join(DATA_DIR, "unified_dataset.json")
-    if os.path.exists(unified_path):
-        with open(unified_path, "r") as f:
-            data = json.load(f)
+    # Try unified dataset first; the newest of the supported formats wins
+    # (older builds wrote one JSON array)
+    unified_path = _newest(
+        "unified_dataset.jsonl", "unified_dataset.parquet", "unified_dataset.json",
+    )
+    if unified_path:
+        data = _read_dataset(unified_path)
         print(f"  Loaded unified dataset ({len(data)} samples)")
         return data
 
     # Fall back to synthetic-only
-    path = os.path.join(DATA_DIR, "training_data.json")
-    if not os.path.exists(path):
+    path = _newest("training_data.json", "training_data.parquet")
+    if path is None:
         print("[!] No training data found. Generating synthetic data...")
         from app.training.generate_data import generate_dataset
         generate_dataset(5000)
+        path = os.path.join(DATA_DIR, "training_data.json")
 
-    with open(path, "r") as f:
-        data = json.load(f)
+    data = _read_dataset(path)
     print(f"  Loaded synthetic dataset ({len(data)} samples)")
     return data
 